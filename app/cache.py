@@ -3,11 +3,13 @@ Cache configuration and management for NFL Trends API.
 
 This module provides caching functionality using cachetools for:
 1. upcoming_games endpoint - Small TTL cache for max 16 entries
-2. weekly_trends endpoint - Larger LRU cache for complex query results
+2. weekly_trends endpoint - Larger LRU cache of pre-serialized query responses
+3. games endpoint - Short TTL cache of pre-serialized responses keyed by filters
 """
 
-import json
+import orjson
 import hashlib
+import threading
 from typing import Any, Dict, List, Optional
 from cachetools import TTLCache, LRUCache
 from datetime import datetime
@@ -15,8 +17,18 @@ from datetime import datetime
 
 # Cache instances
 upcoming_games_cache = TTLCache(maxsize=16, ttl=3600)  # 1 hour TTL, max 16 entries
+# Filled from threadpool workers (cache misses, startup) while hits read it on the event loop
+upcoming_games_cache_lock = threading.Lock()
 weekly_trends_cache = LRUCache(maxsize=100)  # LRU cache for 100 entries
+# LRUCache is not thread-safe (even reads reorder it), and weekly trends are cached from
+# threadpool endpoints and concurrent startup warmups, so every access holds this lock
+weekly_trends_cache_lock = threading.Lock()
 weekly_filter_options_cache = TTLCache(maxsize=1, ttl=3600)  # 1 hour TTL, single entry
+games_cache = TTLCache(maxsize=4096, ttl=60)  # 1 minute TTL, max 4096 serialized responses
+# TTLCache mutates on reads too (expiry relinks its list), and /games runs in the threadpool.
+# The API never writes to games (loads happen outside the app), so entries are only
+# invalidated by the TTL or /cache/clear rather than a write generation counter
+games_cache_lock = threading.Lock()
 
 # Special keys for protected cache entries
 UPCOMING_GAMES_KEY = "upcoming_games_empty_body"
@@ -34,96 +46,128 @@ def generate_cache_key(data: Any) -> str:
     Returns:
         A SHA256 hash string to use as cache key
     """
-    # Convert to JSON string with sorted keys for consistency
-    json_str = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(json_str.encode()).hexdigest()
+    # Serialize to JSON bytes with sorted keys for consistency
+    json_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(json_bytes).hexdigest()
 
 
-def get_upcoming_games_from_cache() -> Optional[Dict]:
+def get_upcoming_games_from_cache() -> Optional[bytes]:
     """
-    Get upcoming games from cache.
+    Get the serialized upcoming games response from cache.
     
     Returns:
-        Cached upcoming games data or None if not found
+        Cached JSON response bytes or None if not found
     """
-    return upcoming_games_cache.get(UPCOMING_GAMES_KEY)
+    with upcoming_games_cache_lock:
+        return upcoming_games_cache.get(UPCOMING_GAMES_KEY)
 
 
-def set_upcoming_games_cache(data: Dict) -> None:
+def set_upcoming_games_cache(data: bytes) -> None:
     """
-    Set upcoming games in cache.
+    Set the serialized upcoming games response in cache.
     
     Args:
-        data: The upcoming games data to cache
+        data: The JSON response bytes to cache
     """
-    upcoming_games_cache[UPCOMING_GAMES_KEY] = data
+    with upcoming_games_cache_lock:
+        upcoming_games_cache[UPCOMING_GAMES_KEY] = data
 
 
-def get_weekly_trends_from_cache(cache_key: str) -> Optional[Dict]:
+def get_weekly_trends_from_cache(cache_key: str) -> Optional[bytes]:
     """
-    Get weekly trends from cache by key.
+    Get a serialized weekly trends response from cache by key.
     
     Args:
         cache_key: The cache key to look up
         
     Returns:
-        Cached weekly trends data or None if not found
+        Cached JSON response bytes or None if not found
     """
-    return weekly_trends_cache.get(cache_key)
+    with weekly_trends_cache_lock:
+        return weekly_trends_cache.get(cache_key)
 
 
-def set_weekly_trends_cache(cache_key: str, data: Dict) -> None:
+def set_weekly_trends_cache(cache_key: str, data: bytes) -> None:
     """
-    Set weekly trends in cache.
+    Set a serialized weekly trends response in cache.
     
     Args:
         cache_key: The cache key to use
-        data: The weekly trends data to cache
+        data: The JSON response bytes to cache
     """
-    weekly_trends_cache[cache_key] = data
+    with weekly_trends_cache_lock:
+        weekly_trends_cache[cache_key] = data
 
 
-def set_initial_weekly_trends_cache(data: Dict) -> None:
+def set_initial_weekly_trends_cache(data: bytes) -> None:
     """
-    Set the initial weekly trends query result in cache.
+    Set the serialized initial weekly trends response in cache.
     This entry should never be removed.
     
     Args:
-        data: The initial weekly trends data to cache
+        data: The JSON response bytes to cache
     """
-    weekly_trends_cache[INITIAL_WEEKLY_TRENDS_KEY] = data
+    with weekly_trends_cache_lock:
+        weekly_trends_cache[INITIAL_WEEKLY_TRENDS_KEY] = data
 
 
-def get_initial_weekly_trends_from_cache() -> Optional[Dict]:
+def get_initial_weekly_trends_from_cache() -> Optional[bytes]:
     """
-    Get the initial weekly trends query result from cache.
+    Get the serialized initial weekly trends response from cache.
     
     Returns:
-        Cached initial weekly trends data or None if not found
+        Cached JSON response bytes or None if not found
     """
-    return weekly_trends_cache.get(INITIAL_WEEKLY_TRENDS_KEY)
+    with weekly_trends_cache_lock:
+        return weekly_trends_cache.get(INITIAL_WEEKLY_TRENDS_KEY)
 
 
-def get_weekly_filter_options_from_cache() -> Optional[Dict]:
+def get_weekly_filter_options_from_cache() -> Optional[bytes]:
     """
-    Get weekly filter options from cache.
+    Get the serialized weekly filter options response from cache.
     
     Returns:
-        Cached weekly filter options data or None if not found
+        Cached JSON response bytes or None if not found
     """
     return weekly_filter_options_cache.get(WEEKLY_FILTER_OPTIONS_KEY)
 
 
-def set_weekly_filter_options_cache(data: Dict) -> None:
+def set_weekly_filter_options_cache(data: bytes) -> None:
     """
-    Set weekly filter options in cache.
+    Set the serialized weekly filter options response in cache.
     
     Args:
-        data: The weekly filter options data to cache
+        data: The JSON response bytes to cache
     """
     weekly_filter_options_cache[WEEKLY_FILTER_OPTIONS_KEY] = data
 
 
+def get_games_from_cache(cache_key: str) -> Optional[bytes]:
+    """
+    Get a serialized games response from cache by key.
+    
+    Args:
+        cache_key: The cache key to look up
+        
+    Returns:
+        Cached JSON response bytes or None if not found
+    """
+    with games_cache_lock:
+        return games_cache.get(cache_key)
+
+
+def set_games_cache(cache_key: str, data: bytes) -> None:
+    """
+    Set a serialized games response in cache.
+    
+    Args:
+        cache_key: The cache key to use
+        data: The JSON response bytes to cache
+    """
+    with games_cache_lock:
+        games_cache[cache_key] = data
+
+
 def clear_upcoming_games_cache(preserve_default: bool = True) -> None:
     """
     Clear upcoming games cache.
@@ -131,12 +175,13 @@ def clear_upcoming_games_cache(preserve_default: bool = True) -> None:
     Args:
         preserve_default: If True, preserve the default upcoming games entry
     """
-    if preserve_default and UPCOMING_GAMES_KEY in upcoming_games_cache:
-        default_data = upcoming_games_cache[UPCOMING_GAMES_KEY]
-        upcoming_games_cache.clear()
-        upcoming_games_cache[UPCOMING_GAMES_KEY] = default_data
-    else:
-        upcoming_games_cache.clear()
+    with upcoming_games_cache_lock:
+        if preserve_default and UPCOMING_GAMES_KEY in upcoming_games_cache:
+            default_data = upcoming_games_cache[UPCOMING_GAMES_KEY]
+            upcoming_games_cache.clear()
+            upcoming_games_cache[UPCOMING_GAMES_KEY] = default_data
+        else:
+            upcoming_games_cache.clear()
 
 
 def clear_weekly_trends_cache(preserve_initial: bool = True) -> None:
@@ -146,12 +191,13 @@ def clear_weekly_trends_cache(preserve_initial: bool = True) -> None:
     Args:
         preserve_initial: If True, preserve the initial weekly trends entry
     """
-    if preserve_initial and INITIAL_WEEKLY_TRENDS_KEY in weekly_trends_cache:
-        initial_data = weekly_trends_cache[INITIAL_WEEKLY_TRENDS_KEY]
-        weekly_trends_cache.clear()
-        weekly_trends_cache[INITIAL_WEEKLY_TRENDS_KEY] = initial_data
-    else:
-        weekly_trends_cache.clear()
+    with weekly_trends_cache_lock:
+        if preserve_initial and INITIAL_WEEKLY_TRENDS_KEY in weekly_trends_cache:
+            initial_data = weekly_trends_cache[INITIAL_WEEKLY_TRENDS_KEY]
+            weekly_trends_cache.clear()
+            weekly_trends_cache[INITIAL_WEEKLY_TRENDS_KEY] = initial_data
+        else:
+            weekly_trends_cache.clear()
 
 
 def clear_weekly_filter_options_cache() -> None:
@@ -161,6 +207,14 @@ def clear_weekly_filter_options_cache() -> None:
     weekly_filter_options_cache.clear()
 
 
+def clear_games_cache() -> None:
+    """
+    Clear games cache.
+    """
+    with games_cache_lock:
+        games_cache.clear()
+
+
 def get_cache_stats() -> Dict[str, Any]:
     """
     Get statistics about all caches.
@@ -168,19 +222,26 @@ def get_cache_stats() -> Dict[str, Any]:
     Returns:
         Dictionary containing cache statistics
     """
+    with upcoming_games_cache_lock:
+        upcoming_games_keys = list(upcoming_games_cache.keys())
+    with weekly_trends_cache_lock:
+        weekly_trends_keys = list(weekly_trends_cache.keys())
+    with games_cache_lock:
+        games_keys = list(games_cache.keys())
+
     return {
         "upcoming_games_cache": {
             "type": "TTLCache",
             "maxsize": upcoming_games_cache.maxsize,
-            "current_size": len(upcoming_games_cache),
+            "current_size": len(upcoming_games_keys),
             "ttl_seconds": upcoming_games_cache.ttl,
-            "keys": list(upcoming_games_cache.keys())
+            "keys": upcoming_games_keys
         },
         "weekly_trends_cache": {
             "type": "LRUCache", 
             "maxsize": weekly_trends_cache.maxsize,
-            "current_size": len(weekly_trends_cache),
-            "keys": list(weekly_trends_cache.keys())
+            "current_size": len(weekly_trends_keys),
+            "keys": weekly_trends_keys
         },
         "weekly_filter_options_cache": {
             "type": "TTLCache",
@@ -189,6 +250,13 @@ def get_cache_stats() -> Dict[str, Any]:
             "ttl_seconds": weekly_filter_options_cache.ttl,
             "keys": list(weekly_filter_options_cache.keys())
         },
+        "games_cache": {
+            "type": "TTLCache",
+            "maxsize": games_cache.maxsize,
+            "current_size": len(games_keys),
+            "ttl_seconds": games_cache.ttl,
+            "keys": games_keys
+        },
         "protected_keys": {
             "upcoming_games_default": UPCOMING_GAMES_KEY,
             "initial_weekly_trends": INITIAL_WEEKLY_TRENDS_KEY,
@@ -208,11 +276,8 @@ def extract_games_from_upcoming_games(upcoming_games_data: Dict) -> List[str]:
     Returns:
         List of game strings in format "HOMEABBREVvsAWAYABBREV"
     """
-    games = []
-    if "upcoming_games" in upcoming_games_data:
-        for game in upcoming_games_data["upcoming_games"]:
-            home_abbrev = game.get("home_abbreviation", "").value
-            away_abbrev = game.get("away_abbreviation", "").value
-            if home_abbrev and away_abbrev:
-                games.append(f"{home_abbrev}vs{away_abbrev}")
-    return games
+    # Abbreviation columns are non-nullable enums, so every game yields a key
+    return [
+        f"{game['home_abbreviation'].value}vs{game['away_abbreviation'].value}"
+        for game in upcoming_games_data.get("upcoming_games", [])
+    ]
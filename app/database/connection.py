@@ -1,6 +1,7 @@
 import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 # Load environment variables from .env file
@@ -16,6 +17,7 @@ DB_PASSWORD = os.getenv("DB_PASSWORD")
 
 # Construct the database URL for SQLAlchemy
 DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+ASYNC_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 # Create the SQLAlchemy engine
 engine = create_engine(DATABASE_URL, echo=True)
@@ -23,6 +25,13 @@ engine = create_engine(DATABASE_URL, echo=True)
 # Create a session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session factory for endpoints that await their queries.
+# SQLAlchemy caches compiled SQL keyed on statement structure (values are bound
+# parameters), so each distinct combination of /trends filters and sort fields
+# compiles once. The cache is sized above the 500 default to hold those shapes.
+async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=True, query_cache_size=2000)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for ORM models
 Base = declarative_base()
 
@@ -35,4 +44,12 @@ def get_connection():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Dependency to provide an async database session
+async def get_async_connection():
+    """
+    Dependency that provides an async SQLAlchemy session.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -1,4 +1,7 @@
+import asyncio
+import logging
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers import games
 from app.routers import trends
@@ -13,15 +16,21 @@ from app.models.email_subscription import EmailSubscription
 
 app = FastAPI()
 
+# Emit the app's own INFO logs (such as the startup cache summary) to stderr; uvicorn only
+# configures its own loggers, and the root logger is left alone so SQL echo is not duplicated
+logging.getLogger("app").setLevel(logging.INFO)
+logging.getLogger("app").addHandler(logging.StreamHandler())
+
 # Add startup event handler for cache initialization
 @app.on_event("startup")
 async def startup_event():
-    """Initialize caches and create database tables on application startup."""
+    """Create database tables and start cache initialization on application startup."""
     # Create database tables
     Base.metadata.create_all(bind=engine)
     
-    # Initialize caches
-    await startup_cache_initialization()
+    # Warm the caches in the background so startup does not wait on the queries;
+    # requests that arrive first miss the cache and query the database directly
+    app.state.cache_warm_task = asyncio.create_task(startup_cache_initialization())
 
 # Add CORS middleware
 app.add_middleware(
@@ -51,4 +60,11 @@ app.include_router(email_subscriptions.router, prefix='/api/v1')
 
 @app.get('/')
 def read_root():
-    return {'message': 'Welcome to the NFL Trends API!'}
\ No newline at end of file
+    return {'message': 'Welcome to the NFL Trends API!'}
+
+@app.get('/ready')
+def read_ready():
+    """Report whether startup cache initialization has finished (503 until it has)."""
+    if app.state.cache_warm_task.done():
+        return {'status': 'ready'}
+    return JSONResponse(status_code=503, content={'status': 'warming'})
\ No newline at end of file
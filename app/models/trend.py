@@ -1,5 +1,5 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, Enum, Boolean, Numeric
+from sqlalchemy import Index, Column, Integer, SmallInteger, String, Enum, Boolean, Numeric, Computed, case
 from app.enums.game_enums import MonthEnum, DayOfWeekEnum
 
 Base = declarative_base()
@@ -7,9 +7,15 @@ Base = declarative_base()
 class Trend(Base):
     __tablename__ = 'trends'
     id = Column(String, primary_key=True)
-    id_string = Column(String, nullable=False)
+    id_string = Column(String, nullable=False, index=True)
     category = Column(String, nullable=False)
     month = Column(Enum(MonthEnum, native_enum=False, values_callable=lambda enum: [e.value for e in enum]), nullable=False)
+    # Calendar number of month (NULL when month is NULL), generated by the database so month ranges and month sorting can use an index
+    month_num = Column(
+        SmallInteger,
+        Computed(case({e.value: number for number, e in enumerate(MonthEnum, start=1)}, value=month), persisted=True),
+        index=True
+    )
     day_of_week = Column(Enum(DayOfWeekEnum, native_enum=False, values_callable=lambda enum: [e.value for e in enum]), nullable=False)
     divisional = Column(Boolean, nullable=False)
     spread = Column(String, nullable=False)
@@ -24,3 +30,6 @@ class Trend(Base):
 
     def __repr__(self):
         return f'<Trend(id={self.id_string}, record={self.wins}-{self.losses}-{self.pushes}, win_pct={self.win_percentage})>'
+
+# Serves the default /trends order (win_percentage DESC, total_games DESC, id) straight off the index
+Index("ix_trends_win_percentage_total_games", Trend.win_percentage.desc(), Trend.total_games.desc(), Trend.id)
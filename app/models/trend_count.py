@@ -0,0 +1,19 @@
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, Integer, SmallInteger, String, Enum
+from app.enums.game_enums import MonthEnum, DayOfWeekEnum
+
+Base = declarative_base()
+
+class TrendCount(Base):
+    __tablename__ = 'trend_counts'
+    # Materialized view of trends grouped by the columns below; refreshed after each trends load
+    category = Column(String, primary_key=True)
+    month = Column(Enum(MonthEnum, native_enum=False, values_callable=lambda enum: [e.value for e in enum]), primary_key=True)
+    month_num = Column(SmallInteger)
+    day_of_week = Column(Enum(DayOfWeekEnum, native_enum=False, values_callable=lambda enum: [e.value for e in enum]), primary_key=True)
+    spread = Column(String, primary_key=True)
+    total = Column(String, primary_key=True)
+    trend_count = Column(Integer, nullable=False)
+
+    def __repr__(self):
+        return f'<TrendCount(category={self.category}, month={self.month}, day_of_week={self.day_of_week}, spread={self.spread}, total={self.total}, count={self.trend_count})>'
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, Enum, Boolean, Numeric
+from sqlalchemy import Index, Column, Integer, String, Enum, Boolean, Numeric
 from app.enums.game_enums import MonthEnum, DayOfWeekEnum
 
 Base = declarative_base()
@@ -25,3 +25,6 @@ class WeeklyTrend(Base):
 
     def __repr__(self):
         return f'<Trend(id={self.id_string}, record={self.wins}-{self.losses}-{self.pushes}, win_pct={self.win_percentage})>'
+
+# Serves the default weekly-trends order (win_percentage DESC, total_games DESC), including the startup top-5000 query
+Index("ix_weekly_trends_win_percentage_total_games", WeeklyTrend.win_percentage.desc(), WeeklyTrend.total_games.desc())
@@ -0,0 +1,67 @@
+"""
+Response serialization helpers for NFL Trends API.
+
+This module serializes endpoint payloads with orjson so that large result pages
+skip FastAPI's recursive jsonable_encoder pass and the stdlib json encoder.
+"""
+
+import orjson
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional
+from fastapi import Response
+
+
+def _default(value: Any) -> Any:
+    """
+    Serialize types orjson does not handle natively.
+
+    Args:
+        value: The value orjson could not serialize
+
+    Returns:
+        A JSON-compatible representation of the value
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes.
+
+    Args:
+        content: The data to serialize (dicts, lists, enums, Decimals, etc.)
+
+    Returns:
+        The UTF-8 encoded JSON document
+    """
+    return orjson.dumps(content, default=_default)
+
+
+def row_to_dict(row: Any, columns: Iterable[str]) -> Dict[str, Any]:
+    """
+    Convert an ORM row to a plain dictionary of its column values.
+
+    Args:
+        row: The ORM instance to convert
+        columns: The column attribute names to include
+
+    Returns:
+        Dictionary mapping column names to values
+    """
+    return {column: getattr(row, column) for column in columns}
+
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Wrap pre-serialized JSON bytes in a response.
+
+    Args:
+        body: The JSON document to send
+        headers: Optional extra response headers
+
+    Returns:
+        A Response FastAPI sends as-is, without re-encoding
+    """
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -6,6 +6,7 @@ This module provides endpoints for:
 2. Clearing caches while preserving protected entries
 """
 
+import orjson
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from app.cache import (
@@ -13,6 +14,7 @@ from app.cache import (
     clear_upcoming_games_cache,
     clear_weekly_trends_cache,
     clear_weekly_filter_options_cache,
+    clear_games_cache,
     get_upcoming_games_from_cache,
     get_initial_weekly_trends_from_cache,
     get_weekly_filter_options_from_cache
@@ -101,6 +103,7 @@ def clear_all_caches_endpoint(preserve_protected: bool = True) -> Dict[str, str]
     try:
         clear_upcoming_games_cache(preserve_default=preserve_protected)
         clear_weekly_trends_cache(preserve_initial=preserve_protected)
+        clear_games_cache()
         
         # Only clear weekly filter options if preserve_protected is False
         if not preserve_protected:
@@ -132,6 +135,21 @@ def clear_weekly_filter_options_cache_endpoint() -> Dict[str, str]:
         raise HTTPException(status_code=500, detail=f"Error clearing weekly filter options cache: {str(e)}")
 
 
+@router.post("/cache/clear/games", summary="Clear games cache", tags=["Cache Management"])
+def clear_games_cache_endpoint() -> Dict[str, str]:
+    """
+    Clear the games response cache.
+    
+    Returns:
+        Success message
+    """
+    try:
+        clear_games_cache()
+        return {"message": "Games cache cleared"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error clearing games cache: {str(e)}")
+
+
 @router.get("/cache/protected-entries", summary="Check protected cache entries", tags=["Cache Management"])
 def get_protected_entries() -> Dict[str, Any]:
     """
@@ -141,9 +159,13 @@ def get_protected_entries() -> Dict[str, Any]:
         Information about protected cache entries
     """
     try:
+        # Cached entries are serialized responses, so decode them to report their contents
         upcoming_games_cached = get_upcoming_games_from_cache()
         initial_trends_cached = get_initial_weekly_trends_from_cache()
         weekly_filter_options_cached = get_weekly_filter_options_from_cache()
+        upcoming_games_cached = orjson.loads(upcoming_games_cached) if upcoming_games_cached else None
+        initial_trends_cached = orjson.loads(initial_trends_cached) if initial_trends_cached else None
+        weekly_filter_options_cached = orjson.loads(weekly_filter_options_cached) if weekly_filter_options_cached else None
         
         return {
             "upcoming_games_default": {
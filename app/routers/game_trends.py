@@ -1,4 +1,5 @@
 import re
+import logging
 import time
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Session
@@ -11,6 +12,8 @@ from app.database.connection import get_connection
 from app.models.game_trend import create_game_trend_model
 from app.enums.trend_enums import CategoryEnum, MonthEnum, DayOfWeekEnum
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 # Cache for game filter options to avoid frequent DB queries
@@ -40,6 +43,15 @@ MONTH_MAPPING = {
     "December": 12,
 }
 
+# Seasons in chronological order; the handler slices this for since_or_* ranges
+VALID_SEASONS = tuple(f"since {year}-{year + 1}" for year in range(2006, 2026))
+VALID_SEASONS_SET = frozenset(VALID_SEASONS)
+SEASON_INDEX = {season: index for index, season in enumerate(VALID_SEASONS)}
+
+# Every game trend table is built by create_game_trend_model with the same columns, so the
+# sortable fields are resolved once from a template model instead of inspecting the mapper per request
+SORT_FIELDS = frozenset(c_attr.key for c_attr in inspect(create_game_trend_model("game_trend_template")).mapper.column_attrs)
+
     ##################################
     ######## FILTER OBJECTS ##########
     ##################################
@@ -110,6 +122,13 @@ class TrendFilter(BaseModel):
             "Example: 0."
         )
     )
+    include_total: bool = Field(
+        True,
+        description=(
+            "Whether to count every matching row for 'total_count'. "
+            "Set to false to skip the count; 'total_count' is then null."
+        )
+    )
 
     # VALIDATE LIMIT is between 1 and 5000
     @validator("limit", pre=True)
@@ -149,7 +168,7 @@ class TrendFilter(BaseModel):
                 raise ValueError(
                     "If trend_id is a string, it must have exactly 7 comma-separated values."
                 )
-            print("TREND ID is a single string.")
+            logger.debug("TREND ID is a single string.")
             return value
 
         elif isinstance(value, list):
@@ -161,7 +180,7 @@ class TrendFilter(BaseModel):
                     raise ValueError(
                         f"Each trend_id in the list must have exactly 7 comma-separated values. Got: {values}"
                     )
-            print("TREND ID is a list of strings.")
+            logger.debug("TREND ID is a list of strings.")
             return value
 
         raise ValueError("trend_id must be either a string or a list of strings.")
@@ -446,21 +465,19 @@ class TrendFilter(BaseModel):
     @validator("seasons")
     def validate_season(cls, seasons):
         if seasons:
-            VALID_SEASONS = [f"since {year}-{year + 1}" for year in range(2006, 2026)]
-
             # Validate exact
             if seasons.exact:
                 exact_list = [seasons.exact] if isinstance(seasons.exact, str) else seasons.exact
                 for s in exact_list:
-                    if s not in VALID_SEASONS:
-                        raise ValueError(f"Invalid seasons in 'exact': '{s}'. Must be one of {VALID_SEASONS}.")
+                    if s not in VALID_SEASONS_SET:
+                        raise ValueError(f"Invalid seasons in 'exact': '{s}'. Must be one of {list(VALID_SEASONS)}.")
                 seasons.exact = exact_list
 
             # Validate since_or_later / since_or_earlier
-            if seasons.since_or_later and seasons.since_or_later not in VALID_SEASONS:
-                raise ValueError(f"'since_or_later' value '{seasons.since_or_later}' is not valid. Must be one of {VALID_SEASONS}.")
-            if seasons.since_or_earlier and seasons.since_or_earlier not in VALID_SEASONS:
-                raise ValueError(f"'since_or_earlier' value '{seasons.since_or_earlier}' is not valid. Must be one of {VALID_SEASONS}.")
+            if seasons.since_or_later and seasons.since_or_later not in VALID_SEASONS_SET:
+                raise ValueError(f"'since_or_later' value '{seasons.since_or_later}' is not valid. Must be one of {list(VALID_SEASONS)}.")
+            if seasons.since_or_earlier and seasons.since_or_earlier not in VALID_SEASONS_SET:
+                raise ValueError(f"'since_or_earlier' value '{seasons.since_or_earlier}' is not valid. Must be one of {list(VALID_SEASONS)}.")
 
         return seasons
 
@@ -732,6 +749,7 @@ def get_game_trends(
     - **max_win_percentage**: Maximum win percentage (inclusive), between 0 and 100 (Ex: 100).
     - **limit**: Limit the number of results returned (Ex: 100).
     - **offset**: Offset the results returned (Ex: 0).
+    - **include_total**: Whether to compute total_count (default True); false skips the COUNT query and returns null.
     - **sort_by**: Sort the results by one or more fields. Can be a single field as a string or dictionary (default is ascending), or a list of fields and directions as dictionaries (Ex: 'month', ['wins', 'total_games'], {'field': 'win_percentage', 'order': 'desc'}, [{'field': 'win_percentage', 'order': 'desc'}, {'field': 'total_games', 'order': 'desc'}]).
     """
     
@@ -761,7 +779,7 @@ def get_game_trends(
         if isinstance(filters.trend_id, str):
             filters_list.append(GameTrend.id_string == filters.trend_id)
         else:
-            print(filters.trend_id)
+            logger.debug("Filtering by trend ids: %s", filters.trend_id)
             filters_list.append(GameTrend.id_string.in_(filters.trend_id))
 
     # Filter by CATEGORY
@@ -818,13 +836,13 @@ def get_game_trends(
 
     # Combine logic: OR between month filter and range
     if month_conditions and range_condition is not None:
-        print("Combining month conditions with range condition")
+        logger.debug("Combining month conditions with range condition")
         filters_list.append(or_(or_(*month_conditions), range_condition))
     elif month_conditions:
-        print("Adding month conditions")
+        logger.debug("Adding month conditions")
         filters_list.append(or_(*month_conditions))
     elif range_condition is not None:
-        print("Adding range condition")
+        logger.debug("Adding range condition")
         filters_list.append(range_condition)
 
     # Filter by DAY OF WEEK
@@ -918,24 +936,23 @@ def get_game_trends(
     # Filter by SEASONS
     if filters.seasons:
         season_clauses = []
-        VALID_SEASONS = [f"since {year}-{year + 1}" for year in range(2006, 2026)]
 
         if filters.seasons.exact:
             season_clauses.append(GameTrend.seasons.in_(filters.seasons.exact))
 
         if filters.seasons.since_or_later:
-            index = VALID_SEASONS.index(filters.seasons.since_or_later)
+            index = SEASON_INDEX[filters.seasons.since_or_later]
             season_clauses.append(GameTrend.seasons.in_(VALID_SEASONS[index:]))
 
         if filters.seasons.since_or_earlier:
-            index = VALID_SEASONS.index(filters.seasons.since_or_earlier)
+            index = SEASON_INDEX[filters.seasons.since_or_earlier]
             season_clauses.append(GameTrend.seasons.in_(VALID_SEASONS[: index + 1]))
 
         if season_clauses:
             filters_list.append(or_(*season_clauses))
 
     # Filter by WINS
-    if filters.wins:
+    if filters.wins not in (None, []):
         if isinstance(filters.wins, int):
             filters_list.append(GameTrend.wins == filters.wins)
         else:
@@ -949,7 +966,7 @@ def get_game_trends(
         filters_list.append(GameTrend.wins <= filters.max_wins)
 
     # Filter by LOSSES
-    if filters.losses:
+    if filters.losses not in (None, []):
         if isinstance(filters.losses, int):
             filters_list.append(GameTrend.losses == filters.losses)
         else:
@@ -963,7 +980,7 @@ def get_game_trends(
         filters_list.append(GameTrend.losses <= filters.max_losses)
 
     # Filter by PUSHES
-    if filters.pushes:
+    if filters.pushes not in (None, []):
         if isinstance(filters.pushes, int):
             filters_list.append(GameTrend.pushes == filters.pushes)
         else:
@@ -977,7 +994,7 @@ def get_game_trends(
         filters_list.append(GameTrend.pushes <= filters.max_pushes)
 
     # Filter by TOTAL GAMES
-    if filters.total_games:
+    if filters.total_games not in (None, []):
         if isinstance(filters.total_games, int):
             filters_list.append(GameTrend.total_games == filters.total_games)
         else:
@@ -990,8 +1007,8 @@ def get_game_trends(
     elif filters.max_total_games is not None:
         filters_list.append(GameTrend.total_games <= filters.max_total_games)
 
-    # Filter by WIN PERCENTAGE
-    if filters.win_percentage:
+    # Filter by WIN PERCENTAGE (0 is a valid percentage, so only None or an empty list skip it)
+    if filters.win_percentage not in (None, []):
         if isinstance(filters.win_percentage, float):
             filters_list.append(GameTrend.win_percentage == filters.win_percentage)
         else:
@@ -1008,14 +1025,14 @@ def get_game_trends(
     if filters_list:
         query = query.filter(*filters_list)
 
-    total_count = query.order_by(None).count()
+    # The COUNT re-runs the whole filtered query, so it is skipped when the caller opts out
+    total_count = query.order_by(None).count() if filters.include_total else None
 
     # Sorting
-    valid_sort_fields = {c_attr.key for c_attr in inspect(GameTrend).mapper.column_attrs}
     if filters.sort_by:
         sort_columns = []
         for sort in filters.sort_by:
-            if sort.field not in valid_sort_fields:
+            if sort.field not in SORT_FIELDS:
                 raise HTTPException(status_code=400, detail=f"Invalid sort field: {sort.field}")
 
             if sort.field == "month":
@@ -1,17 +1,25 @@
 import re
+import logging
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Session
 from sqlalchemy.inspection import inspect
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Union, Literal
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy import case, Integer, cast, and_, or_
+from sqlalchemy import case, Integer, cast, and_, or_, text, select
 from app.models.game import Game
 from app.database.connection import get_connection
+from app.responses import dumps, row_to_dict, json_response
+from app.cache import generate_cache_key, get_games_from_cache, set_games_cache
 from app.enums.game_enums import MonthEnum, DayOfWeekEnum, FullTeamNameEnum, TeamAbbreviationEnum, DivisionEnum
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Column attributes serialized for each game in the response
+GAME_COLUMNS = tuple(c_attr.key for c_attr in inspect(Game).mapper.column_attrs)
+
 MONTH_MAPPING = {
     "January": 1,
     "February": 2,
@@ -27,16 +35,107 @@ MONTH_MAPPING = {
     "December": 12,
 }
 
+def estimate_games_count(db: Session) -> int:
+    """
+    Estimate the number of rows in the games table from the planner statistics in pg_class.
+    Falls back to an exact count if the table has not been analyzed yet.
+    """
+    estimate = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"),
+        {"table_name": Game.__tablename__}
+    ).scalar()
+    if estimate is None or estimate < 0:
+        # Count directly rather than through Query.count(), which wraps the query in a subquery
+        return db.scalar(select(func.count()).select_from(Game))
+    return int(estimate)
+
+def match_values(column, values):
+    """
+    Build an equality clause for a single-element list or an IN clause for a longer list.
+    Single-element lists collapse to equality so the planner sees `=` rather than `IN (?)`.
+    """
+    if len(values) == 1:
+        return column == values[0]
+    return column.in_(values)
+
+# Boolean outcomes that can never both be True for the same game
+MUTUALLY_EXCLUSIVE_FILTERS = [
+    ("home_win", "away_win"),
+    ("favorite_win", "underdog_win"),
+    ("home_favorite", "away_favorite"),
+    ("home_underdog", "away_underdog"),
+    ("home_favorite", "home_underdog"),
+    ("away_favorite", "away_underdog"),
+    ("home_cover", "away_cover"),
+    ("favorite_cover", "underdog_cover"),
+    ("over_hit", "under_hit"),
+]
+
+# Range bounds that match nothing when the lower bound is above the upper bound
+RANGE_FILTERS = [
+    ("start_date", "end_date"),
+    ("start_day", "end_day"),
+    ("start_year", "end_year"),
+    ("start_season", "end_season"),
+    ("min_home_score", "max_home_score"),
+    ("min_away_score", "max_away_score"),
+    ("min_combined_score", "max_combined_score"),
+    ("min_spread", "max_spread"),
+    ("min_home_spread", "max_home_spread"),
+    ("min_home_spread_result", "max_home_spread_result"),
+    ("min_away_spread", "max_away_spread"),
+    ("min_away_spread_result", "max_away_spread_result"),
+    ("min_total", "max_total"),
+]
+
+# (predicate, reason) pairs for filter combinations that can never match a game
+UNSATISFIABLE_FILTER_RULES = [
+    (
+        lambda f, a=a, b=b: getattr(f, a) is True and getattr(f, b) is True,
+        f"{a} and {b} cannot both be True"
+    )
+    for a, b in MUTUALLY_EXCLUSIVE_FILTERS
+] + [
+    (
+        lambda f, lo=lo, hi=hi: getattr(f, lo) is not None and getattr(f, hi) is not None and getattr(f, lo) > getattr(f, hi),
+        f"{lo} is greater than {hi}"
+    )
+    for lo, hi in RANGE_FILTERS
+] + [
+    (
+        lambda f: f.start_month is not None and f.end_month is not None and MONTH_MAPPING[f.start_month] > MONTH_MAPPING[f.end_month],
+        "start_month is after end_month"
+    )
+]
+
+def find_unsatisfiable_filter(filters) -> Optional[str]:
+    """
+    Return the reason the filter combination can never match a game, or None if it may match.
+    """
+    for predicate, reason in UNSATISFIABLE_FILTER_RULES:
+        if predicate(filters):
+            return reason
+    return None
+
 class SortField(BaseModel):
     field: str
     order: Literal["asc", "desc"] = "asc"
 
 class GameFilter(BaseModel):
+    # WRAP single values into one-element lists so every list filter reaches get_games as a list.
+    # Declared before the per-field validators below, so it runs after them and they still see the raw value.
+    @field_validator("game_id", "date", "month", "day", "year", "season", "day_of_week", "home_team", "away_team", "home_abbreviation", "away_abbreviation", "home_division", "away_division", "home_score", "away_score", "combined_score", "winner", "loser", "spread", "home_spread", "home_spread_result", "away_spread", "away_spread_result", "total", mode="before")
+    @classmethod
+    def wrap_single_value(cls, value):
+        if value is None or isinstance(value, list):
+            return value
+        return [value]
+
     ############################
     ###### GAME ID FILTERS #####
     ############################
 
-    game_id: Optional[Union[str, List[str]]] = Field(
+    game_id: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by game ID(s). The format is: home team abbreviation + away team abbreviation + yyyymmdd. "
@@ -46,7 +145,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE GAME_IDS are in the format home team abbreviation + away team abbreviation + yyyymmdd
-    @validator("game_id", pre=True)
+    @field_validator("game_id", mode="before")
+    @classmethod
     def validate_game_id_format(cls, value):
         game_id_pattern = r"^[A-Za-z]{2,3}[A-Za-z]{2,3}\d{8}$"
         if isinstance(value, str):
@@ -71,7 +171,7 @@ class GameFilter(BaseModel):
     ####### DATE FILTERS #######
     ############################
 
-    date: Optional[Union[str, List[str]]] = Field(
+    date: Optional[List[str]] = Field(
         None,
         description="Filter by date in the format yyyy-mm-dd. Can be a single date or a list of dates."
     )
@@ -85,7 +185,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE DATES are in the format yyyy-mm-dd
-    @validator("date", "start_date", "end_date", pre=True)
+    @field_validator("date", "start_date", "end_date", mode="before")
+    @classmethod
     def validate_date_format(cls, value):
         if isinstance(value, str):
             # Validate a single date
@@ -103,7 +204,7 @@ class GameFilter(BaseModel):
     ####### MONTH FILTERS ######
     ############################
 
-    month: Optional[Union[str, List[str]]] = Field(
+    month: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by month. Can be a single month or a list of months. "
@@ -120,7 +221,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATES MONTHS are in the MonthEnum format
-    @validator("month", "start_month", "end_month", pre=True)
+    @field_validator("month", "start_month", "end_month", mode="before")
+    @classmethod
     def validate_month(cls, value):
         if isinstance(value, str):
             # Validate a single month
@@ -140,7 +242,7 @@ class GameFilter(BaseModel):
     ######## DAY FILTERS #######
     ############################
 
-    day: Optional[Union[int, List[int]]] = Field(
+    day: Optional[List[int]] = Field(
         None,
         description=(
             "Filter by day(s) of the month. Can be a single day (1-31) or a list of days. "
@@ -157,7 +259,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE DAYS are between 1 and 31
-    @validator("day", "start_day", "end_day", pre=True)
+    @field_validator("day", "start_day", "end_day", mode="before")
+    @classmethod
     def validate_day(cls, value):
         if isinstance(value, int):
             if not (1 <= value <= 31):
@@ -171,7 +274,7 @@ class GameFilter(BaseModel):
     ############################
     ####### YEAR FILTERS #######
     ############################
-    year: Optional[Union[int, List[int]]] = Field(
+    year: Optional[List[int]] = Field(
         None,
         description=(
             "Filter by year(s). Can be a single year (2006-2025) or a list of years. "
@@ -188,7 +291,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE YEARS are between 2006 and 2025
-    @validator("year", "start_year", "end_year", pre=True)
+    @field_validator("year", "start_year", "end_year", mode="before")
+    @classmethod
     def validate_year(cls, value):
         if isinstance(value, int):
             if not (2006 <= value <= 2025):
@@ -204,7 +308,7 @@ class GameFilter(BaseModel):
     ##### SEASON FILTERS #####
     ##########################
 
-    season: Optional[Union[str, List[str]]] = Field(
+    season: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by season. Can be a single season ('2006-2007' - '2024-2025') or a list of seasons. "
@@ -221,7 +325,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE SEASONS are in the format yyyy-yyyy
-    @validator("season", "start_season", "end_season", pre=True)
+    @field_validator("season", "start_season", "end_season", mode="before")
+    @classmethod
     def validate_season_format(cls, value):
         if isinstance(value, str):
             # Validate a single season
@@ -258,7 +363,7 @@ class GameFilter(BaseModel):
     ##### DAY OF WEEK FILTERS #####
     ###############################
 
-    day_of_week: Optional[Union[str, List[str]]] = Field(
+    day_of_week: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by day of the week. Can be a single day or a list of days. "
@@ -267,7 +372,8 @@ class GameFilter(BaseModel):
     )
     
     # VALIDATE DAY OF WEEK are in the DayOfWeekEnum format
-    @validator("day_of_week", pre=True)
+    @field_validator("day_of_week", mode="before")
+    @classmethod
     def validate_day_of_week(cls, value):
         if isinstance(value, str):
             # Validate a single day of the week
@@ -290,14 +396,14 @@ class GameFilter(BaseModel):
     ####### TEAM FILTERS ########
     #############################
 
-    home_team: Optional[Union[str, List[str]]] = Field(
+    home_team: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by home team. Can be a single team or a list of teams. "
             "Example: 'New York Jets' or ['New York Jets', 'New England Patriots']."
         )
     )
-    away_team: Optional[Union[str, List[str]]] = Field(
+    away_team: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by away team. Can be a single team or a list of teams. "
@@ -306,7 +412,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE TEAMS are in the FullTeamNameEnum format
-    @validator("home_team", "away_team", pre=True)
+    @field_validator("home_team", "away_team", mode="before")
+    @classmethod
     def validate_team(cls, value):
         def normalize(v: str) -> str:
             # Match case-insensitively against the enum values
@@ -328,14 +435,14 @@ class GameFilter(BaseModel):
     #### TEAM ABBREVIATION FILTERS ###
     ##################################
 
-    home_abbreviation: Optional[Union[str, List[str]]] = Field(
+    home_abbreviation: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by home team abbreviation. Can be a single abbreviation or a list of abbreviations. "
             "Example: 'NYJ' or ['NYJ', 'NE']."
         )
     )
-    away_abbreviation: Optional[Union[str, List[str]]] = Field(
+    away_abbreviation: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by away team abbreviation. Can be a single abbreviation or a list of abbreviations. "
@@ -344,7 +451,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE TEAM ABBREVIATIONS are in the TeamAbbreviationEnum format
-    @validator("home_abbreviation", "away_abbreviation", pre=True)
+    @field_validator("home_abbreviation", "away_abbreviation", mode="before")
+    @classmethod
     def validate_team_abbreviation(cls, value):
         if isinstance(value, str):
             # Validate a single abbreviation
@@ -364,14 +472,14 @@ class GameFilter(BaseModel):
     ##### TEAM DIVISION FILTERS ######
     ##################################
 
-    home_division: Optional[Union[str, List[str]]] = Field(
+    home_division: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by home team division. Can be a single division or a list of divisions. "
             "Example: 'AFC East' or ['AFC East', 'AFC North']."
         )
     )
-    away_division: Optional[Union[str, List[str]]] = Field(
+    away_division: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by away team division. Can be a single division or a list of divisions. "
@@ -380,7 +488,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE TEAM DIVISIONS are in the DivisionEnum format
-    @validator("home_division", "away_division", pre=True)
+    @field_validator("home_division", "away_division", mode="before")
+    @classmethod
     def validate_team_division(cls, value):
         if isinstance(value, str):
             # Validate a single division
@@ -408,7 +517,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE DIVISIONAL is a boolean
-    @validator("divisional", pre=True)
+    @field_validator("divisional", mode="before")
+    @classmethod
     def validate_divisional(cls, value):
         if not isinstance(value, bool):
             raise ValueError("Divisional must be a boolean value (True or False)")
@@ -418,7 +528,7 @@ class GameFilter(BaseModel):
     ####### HOME SCORE FILTERS #######
     ##################################
 
-    home_score: Optional[Union[int, List[int]]] = Field(
+    home_score: Optional[List[int]] = Field(
         None,
         description=(
             "Filter by home score. Can be a single score or a list of scores. "
@@ -435,7 +545,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE HOME SCORE is between 0 and 100
-    @validator("home_score", "min_home_score", "max_home_score", pre=True)
+    @field_validator("home_score", "min_home_score", "max_home_score", mode="before")
+    @classmethod
     def validate_home_score(cls, value):
         if isinstance(value, int):
             if not (0 <= value <= 100):
@@ -450,7 +561,7 @@ class GameFilter(BaseModel):
     ####### AWAY SCORE FILTERS #######
     ##################################
 
-    away_score: Optional[Union[int, List[int]]] = Field(
+    away_score: Optional[List[int]] = Field(
         None,
         description=(
             "Filter by away score. Can be a single score or a list of scores. "
@@ -467,7 +578,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE AWAY SCORE is between 0 and 100
-    @validator("away_score", "min_away_score", "max_away_score", pre=True)
+    @field_validator("away_score", "min_away_score", "max_away_score", mode="before")
+    @classmethod
     def validate_away_score(cls, value):
         if isinstance(value, int):
             if not (0 <= value <= 100):
@@ -482,7 +594,7 @@ class GameFilter(BaseModel):
     ##### COMBINED SCORE FILTERS #####
     ##################################
 
-    combined_score: Optional[Union[int, List[int]]] = Field(
+    combined_score: Optional[List[int]] = Field(
         None,
         description=(
             "Filter by combined score. Can be a single score or a list of scores. "
@@ -499,7 +611,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE COMBINED SCORE is between 0 and 200
-    @validator("combined_score", "min_combined_score", "max_combined_score", pre=True)
+    @field_validator("combined_score", "min_combined_score", "max_combined_score", mode="before")
+    @classmethod
     def validate_combined_score(cls, value):
         if isinstance(value, int):
             if not (0 <= value <= 200):
@@ -523,7 +636,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE TIE is a boolean
-    @validator("tie", pre=True)
+    @field_validator("tie", mode="before")
+    @classmethod
     def validate_tie(cls, value):
         if not isinstance(value, bool):
             raise ValueError("Tie must be a boolean value (True or False)")
@@ -534,14 +648,14 @@ class GameFilter(BaseModel):
     ###### WINNER/LOSER FILTERS #######
     ###################################
 
-    winner: Optional[Union[str, List[str]]] = Field(
+    winner: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by winner. Can be a single team or a list of teams. "
             "Example: 'New York Jets' or ['New York Jets', 'New England Patriots']."
         )
     )
-    loser: Optional[Union[str, List[str]]] = Field(
+    loser: Optional[List[str]] = Field(
         None,
         description=(
             "Filter by loser. Can be a single team or a list of teams. "
@@ -550,7 +664,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE WINNER/LOSER are in the FullTeamNameEnum format
-    @validator("winner", "loser", pre=True)
+    @field_validator("winner", "loser", mode="before")
+    @classmethod
     def validate_winner_loser(cls, value):
         def normalize(v: str) -> str:
             # Match case-insensitively against the enum values
@@ -572,7 +687,7 @@ class GameFilter(BaseModel):
     ######## SPREAD FILTERS ##########
     ##################################
 
-    spread: Optional[Union[float, List[float]]] = Field(
+    spread: Optional[List[float]] = Field(
         None,
         description=(
             "Filter by spread. Can be a single spread or a list of spreads. "
@@ -589,7 +704,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE SPREAD is between 0 and 27. And ends with .0 or .5
-    @validator("spread", "min_spread", "max_spread", pre=True)
+    @field_validator("spread", "min_spread", "max_spread", mode="before")
+    @classmethod
     def validate_spread(cls, value):
         if isinstance(value, float):
             if not (0 <= value <= 27) or (value * 10) % 5 != 0:
@@ -604,7 +720,7 @@ class GameFilter(BaseModel):
     ###### HOME SPREAD FILTERS #######
     ##################################
 
-    home_spread: Optional[Union[float, List[float]]] = Field(
+    home_spread: Optional[List[float]] = Field(
         None,
         description=(
             "Filter by home spread. Can be a single spread or a list of spreads. "
@@ -621,7 +737,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE HOME SPREAD is between -27 and 27. And ends with .0 or .5
-    @validator("home_spread", "min_home_spread", "max_home_spread", pre=True)
+    @field_validator("home_spread", "min_home_spread", "max_home_spread", mode="before")
+    @classmethod
     def validate_home_spread(cls, value):
         if isinstance(value, float):
             if not (-27 <= value <= 27) or (value * 10) % 5 != 0:
@@ -636,7 +753,7 @@ class GameFilter(BaseModel):
     ### HOME SPREAD RESULT FILTERS ###
     ##################################
 
-    home_spread_result: Optional[Union[int, List[int]]] = Field(
+    home_spread_result: Optional[List[int]] = Field(
         None,
         description=(
             "Filter by home spread result. Can be a single spread result or a list of spreads. "
@@ -653,7 +770,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE HOME SPREAD RESULT is between -100 and 100
-    @validator("home_spread_result", "min_home_spread_result", "max_home_spread_result", pre=True)
+    @field_validator("home_spread_result", "min_home_spread_result", "max_home_spread_result", mode="before")
+    @classmethod
     def validate_home_spread_result(cls, value):
         if isinstance(value, int):
             if not (-100 <= value <= 100):
@@ -669,7 +787,7 @@ class GameFilter(BaseModel):
     ###### AWAY SPREAD FILTERS #######
     ##################################
 
-    away_spread: Optional[Union[float, List[float]]] = Field(
+    away_spread: Optional[List[float]] = Field(
         None,
         description=(
             "Filter by away spread. Can be a single spread or a list of spreads. "
@@ -686,7 +804,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE AWAY SPREAD is between -27 and 27. And ends with .0 or .5
-    @validator("away_spread", "min_away_spread", "max_away_spread", pre=True)
+    @field_validator("away_spread", "min_away_spread", "max_away_spread", mode="before")
+    @classmethod
     def validate_away_spread(cls, value):
         if isinstance(value, float):
             if not (-27 <= value <= 27) or (value * 10) % 5 != 0:
@@ -702,7 +821,7 @@ class GameFilter(BaseModel):
     ### AWAY SPREAD RESULT FILTERS ###
     ##################################
 
-    away_spread_result: Optional[Union[int, List[int]]] = Field(
+    away_spread_result: Optional[List[int]] = Field(
         None,
         description=(
             "Filter by away spread result. Can be a single spread result or a list of spreads. "
@@ -719,7 +838,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE AWAY SPREAD RESULT is between -100 and 100
-    @validator("away_spread_result", "min_away_spread_result", "max_away_spread_result", pre=True)
+    @field_validator("away_spread_result", "min_away_spread_result", "max_away_spread_result", mode="before")
+    @classmethod
     def validate_away_spread_result(cls, value):
         if isinstance(value, int):
             if not (-100 <= value <= 100):
@@ -744,7 +864,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE SPREAD PUSH is a boolean
-    @validator("spread_push", pre=True)
+    @field_validator("spread_push", mode="before")
+    @classmethod
     def validate_spread_push(cls, value):
         if not isinstance(value, bool):
             raise ValueError("Spread push must be a boolean value (True or False)")
@@ -763,7 +884,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE PK is a boolean
-    @validator("pk", pre=True)
+    @field_validator("pk", mode="before")
+    @classmethod
     def validate_pk(cls, value):
         if not isinstance(value, bool):
             raise ValueError("pk must be a boolean value (True or False)")
@@ -774,7 +896,7 @@ class GameFilter(BaseModel):
     ######### TOTAL FILTERS ##########
     ##################################
 
-    total: Optional[Union[float, List[float]]] = Field(
+    total: Optional[List[float]] = Field(
         None,
         description=(
             "Filter by total. Can be a single total or a list of totals. "
@@ -791,7 +913,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE TOTAL is between 0 and 100. And ends with .0 or .5
-    @validator("total", "min_total", "max_total", pre=True)
+    @field_validator("total", "min_total", "max_total", mode="before")
+    @classmethod
     def validate_total(cls, value):
         if isinstance(value, float):
             if not (0 <= value <= 100) or (value * 10) % 5 != 0:
@@ -815,7 +938,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE TOTAL PUSH is a boolean
-    @validator("total_push", pre=True)
+    @field_validator("total_push", mode="before")
+    @classmethod
     def validate_total_push(cls, value):
         if not isinstance(value, bool):
             raise ValueError("Total push must be a boolean value (True or False)")
@@ -855,7 +979,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE HOME/AWAY FAVORITE/UNDERDOG is a boolean
-    @validator("home_favorite", "away_favorite", "home_underdog", "away_underdog", pre=True)
+    @field_validator("home_favorite", "away_favorite", "home_underdog", "away_underdog", mode="before")
+    @classmethod
     def validate_favorite_underdog(cls, value):
         if not isinstance(value, bool):
             raise ValueError("Favorite/underdog must be a boolean value (True or False)")
@@ -923,7 +1048,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE HOME/AWAY FAVORITE/UNDERDOG WIN is a boolean
-    @validator("home_win", "away_win", "favorite_win", "underdog_win", "home_favorite_win", "away_favorite_win", "home_underdog_win", "away_underdog_win", pre=True)
+    @field_validator("home_win", "away_win", "favorite_win", "underdog_win", "home_favorite_win", "away_favorite_win", "home_underdog_win", "away_underdog_win", mode="before")
+    @classmethod
     def validate_favorite_underdog_win(cls, value):
         if not isinstance(value, bool):
             raise ValueError("Favorite/underdog win must be a boolean value (True or False)")
@@ -991,7 +1117,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE HOME/AWAY FAVORITE/UNDERDOG COVER is a boolean
-    @validator("home_cover", "away_cover", "favorite_cover", "underdog_cover", "home_favorite_cover", "away_favorite_cover", "home_underdog_cover", "away_underdog_cover", pre=True)
+    @field_validator("home_cover", "away_cover", "favorite_cover", "underdog_cover", "home_favorite_cover", "away_favorite_cover", "home_underdog_cover", "away_underdog_cover", mode="before")
+    @classmethod
     def validate_favorite_underdog_cover(cls, value):
         if not isinstance(value, bool):
             raise ValueError("Favorite/underdog cover must be a boolean value (True or False)")
@@ -1017,7 +1144,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE OVER/UNDER HIT is a boolean
-    @validator("over_hit", "under_hit", pre=True)
+    @field_validator("over_hit", "under_hit", mode="before")
+    @classmethod
     def validate_over_under_hit(cls, value):
         if not isinstance(value, bool):
             raise ValueError("Over/under hit must be a boolean value (True or False)")
@@ -1043,13 +1171,15 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE LIMIT is between 1 and 1000
-    @validator("limit", pre=True)
+    @field_validator("limit", mode="before")
+    @classmethod
     def validate_limit(cls, value):
         if not isinstance(value, int) or not (1 <= value <= 1000):
             raise ValueError("Limit must be an integer between 1 and 1000")
         return value
     # VALIDATE OFFSET is greater than 0
-    @validator("offset", pre=True)
+    @field_validator("offset", mode="before")
+    @classmethod
     def validate_offset(cls, value):
         if not isinstance(value, int) or value < 0:
             raise ValueError("Offset must be an integer greater than or equal to 0")
@@ -1071,7 +1201,8 @@ class GameFilter(BaseModel):
     )
 
     # VALIDATE SORTING is a list of SortField objects or strings
-    @validator("sort_by", pre=True)
+    @field_validator("sort_by", mode="before")
+    @classmethod
     def validate_sort_by(cls, value):
         if not value:
             return None
@@ -1198,37 +1329,44 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
     - **sort_by**: Sort the results by one or more fields. (Ex: 'date' or ['month', 'year'] or {'season': 'desc'} or [{'field': 'date', 'order': 'asc'}, {'field': 'home_team', 'order': 'desc'}]).
     """
 
-    query = db.query(Game)
+    # Generate cache key from filters
+    cache_key = generate_cache_key(filters.model_dump(exclude_none=True))
+
+    # Try to get from cache first
+    cached_data = get_games_from_cache(cache_key)
+    if cached_data is not None:
+        logger.debug("Games cache hit for key: %s...", cache_key[:16])
+        return json_response(cached_data, headers={"x-cache": "hit"})
+
+    # Skip the database entirely for filter combinations that can never match
+    unsatisfiable_reason = find_unsatisfiable_filter(filters)
+    if unsatisfiable_reason:
+        logger.debug("Returning no games without querying: %s", unsatisfiable_reason)
+        result = dumps([])
+        set_games_cache(cache_key, result)
+        return json_response(result)
+
     filters_list = []
 
     # Filter by GAME ID
     if filters.game_id:
-        if isinstance(filters.game_id, str):
-            filters_list.append(Game.id_string == filters.game_id)
-        else:
-            filters_list.append(Game.id_string.in_(filters.game_id))
+        filters_list.append(match_values(Game.id_string, filters.game_id))
 
     # Filter by DATE
     if filters.date:
-        if isinstance(filters.date, str):
-            filters_list.append(Game.date == filters.date)
-        else:
-            filters_list.append(Game.date.in_(filters.date))
+        filters_list.append(match_values(Game.date, filters.date))
 
     # Filter by a DATE RANGE
-    if filters.start_date and filters.end_date:
+    if filters.start_date is not None and filters.end_date is not None:
         filters_list.append(Game.date.between(filters.start_date, filters.end_date))
-    elif filters.start_date:
+    elif filters.start_date is not None:
         filters_list.append(Game.date >= filters.start_date)
-    elif filters.end_date:
+    elif filters.end_date is not None:
         filters_list.append(Game.date <= filters.end_date)
 
     # Filter by MONTH
     if filters.month:
-        if isinstance(filters.month, str):
-            filters_list.append(Game.month == filters.month)
-        else:
-            filters_list.append(Game.month.in_(filters.month))
+        filters_list.append(match_values(Game.month, filters.month))
     
     # Filter by a MONTH RANGE
     # Map database month strings to their numeric equivalents
@@ -1261,61 +1399,49 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
 
     # Filter by DAY
     if filters.day:
-        if isinstance(filters.day, int):
-            filters_list.append(Game.day == filters.day)
-        else:
-            filters_list.append(Game.day.in_(filters.day))
+        filters_list.append(match_values(Game.day, filters.day))
 
     # Filter by a DAY RANGE
-    if filters.start_day and filters.end_day:
+    if filters.start_day is not None and filters.end_day is not None:
         filters_list.append(Game.day.between(filters.start_day, filters.end_day))
-    elif filters.start_day:
+    elif filters.start_day is not None:
         filters_list.append(Game.day >= filters.start_day)
-    elif filters.end_day:
+    elif filters.end_day is not None:
         filters_list.append(Game.day <= filters.end_day)
 
     # Filter by YEAR
     if filters.year:
-        if isinstance(filters.year, int):
-            filters_list.append(Game.year == filters.year)
-        else:
-            filters_list.append(Game.year.in_(filters.year))
+        filters_list.append(match_values(Game.year, filters.year))
 
     # Filter by a YEAR RANGE
-    if filters.start_year and filters.end_year:
+    if filters.start_year is not None and filters.end_year is not None:
         filters_list.append(Game.year.between(filters.start_year, filters.end_year))
-    elif filters.start_year:
+    elif filters.start_year is not None:
         filters_list.append(Game.year >= filters.start_year)
-    elif filters.end_year:
+    elif filters.end_year is not None:
         filters_list.append(Game.year <= filters.end_year)
 
     # Filter by SEASON
     if filters.season:
-        if isinstance(filters.season, str):
-            filters_list.append(Game.season == filters.season)
-        else:
-            filters_list.append(Game.season.in_(filters.season))
+        filters_list.append(match_values(Game.season, filters.season))
 
     # Filter by a SEASON RANGE
     start_season_year = cast(func.substr(Game.season, 1, 4), Integer)
 
-    if filters.start_season and filters.end_season:
+    if filters.start_season is not None and filters.end_season is not None:
         start = int(filters.start_season[:4])
         end = int(filters.end_season[:4])
         filters_list.append(start_season_year.between(start, end))
-    elif filters.start_season:
+    elif filters.start_season is not None:
         start = int(filters.start_season[:4])
         filters_list.append(start_season_year >= start)
-    elif filters.end_season:
+    elif filters.end_season is not None:
         end = int(filters.end_season[:4])
         filters_list.append(start_season_year <= end)
 
     # Filter by DAY OF WEEK
     if filters.day_of_week:
-        if isinstance(filters.day_of_week, str):
-            filters_list.append(Game.day_of_week == filters.day_of_week)
-        else:
-            filters_list.append(Game.day_of_week.in_(filters.day_of_week))
+        filters_list.append(match_values(Game.day_of_week, filters.day_of_week))
 
     # Filter by HOME TEAM and AWAY TEAM
     # Ex: if you want to see all Chicago Bears games, you would use {"home_team": "Chicago Bears", "away_team": "Chicago Bears"}
@@ -1323,15 +1449,8 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
     #     were away you would use {"home_team": "Chicago Bears", "away_team": "New York Jets"}
     # Ex: If you want to see all the games between the Chicago Bears and the New York Jets, regardless of who was home and who 
     #     was away, you would use {"home_team": ["Chicago Bears", "New York Jets"], "away_team": ["Chicago Bears", "New York Jets"]}
-    def normalize_to_list(value):
-        if isinstance(value, list):
-            return value
-        elif value:
-            return [value]
-        return []
-
-    home_teams = normalize_to_list(filters.home_team)
-    away_teams = normalize_to_list(filters.away_team)
+    home_teams = filters.home_team or []
+    away_teams = filters.away_team or []
 
     # Case: Both home_team and away_team are provided
     if home_teams and away_teams:
@@ -1339,8 +1458,8 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
             # Scenario 1: All games involving any of the teams
             filters_list.append(
                 or_(
-                    Game.home_team.in_(home_teams),
-                    Game.away_team.in_(away_teams)
+                    match_values(Game.home_team, home_teams),
+                    match_values(Game.away_team, away_teams)
                 )
             )
         elif len(home_teams) == 1 and len(away_teams) == 1:
@@ -1356,25 +1475,25 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
             filters_list.append(
                 or_(
                     and_(
-                        Game.home_team.in_(home_teams),
-                        Game.away_team.in_(away_teams)
+                        match_values(Game.home_team, home_teams),
+                        match_values(Game.away_team, away_teams)
                     ),
                     and_(
-                        Game.home_team.in_(away_teams),
-                        Game.away_team.in_(home_teams)
+                        match_values(Game.home_team, away_teams),
+                        match_values(Game.away_team, home_teams)
                     )
                 )
             )
     elif home_teams:
         # Case: Only home_team(s) provided
-        filters_list.append(Game.home_team.in_(home_teams))
+        filters_list.append(match_values(Game.home_team, home_teams))
     elif away_teams:
         # Case: Only away_team(s) provided
-        filters_list.append(Game.away_team.in_(away_teams))
+        filters_list.append(match_values(Game.away_team, away_teams))
 
     # Filter by HOME TEAM ABBREVIATION and AWAY TEAM ABBREVIATION
-    home_abbreviations = normalize_to_list(filters.home_abbreviation)
-    away_abbreviations = normalize_to_list(filters.away_abbreviation)
+    home_abbreviations = filters.home_abbreviation or []
+    away_abbreviations = filters.away_abbreviation or []
 
     # Case: Both home_abbreviation and away_abbreviation are provided
     if home_abbreviations and away_abbreviations:
@@ -1382,8 +1501,8 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
             # Scenario 1: All games involving any of the teams
             filters_list.append(
                 or_(
-                    Game.home_abbreviation.in_(home_abbreviations),
-                    Game.away_abbreviation.in_(away_abbreviations)
+                    match_values(Game.home_abbreviation, home_abbreviations),
+                    match_values(Game.away_abbreviation, away_abbreviations)
                 )
             )
         elif len(home_abbreviations) == 1 and len(away_abbreviations) == 1:
@@ -1399,37 +1518,37 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
             filters_list.append(
                 or_(
                     and_(
-                        Game.home_abbreviation.in_(home_abbreviations),
-                        Game.away_abbreviation.in_(away_abbreviations)
+                        match_values(Game.home_abbreviation, home_abbreviations),
+                        match_values(Game.away_abbreviation, away_abbreviations)
                     ),
                     and_(
-                        Game.home_abbreviation.in_(away_abbreviations),
-                        Game.away_abbreviation.in_(home_abbreviations)
+                        match_values(Game.home_abbreviation, away_abbreviations),
+                        match_values(Game.away_abbreviation, home_abbreviations)
                     )
                 )
             )
     elif home_abbreviations:
         # Case: Only home_abbreviation(s) provided
-        filters_list.append(Game.home_abbreviation.in_(home_abbreviations))
+        filters_list.append(match_values(Game.home_abbreviation, home_abbreviations))
     elif away_abbreviations:
         # Case: Only away_abbreviation(s) provided
-        filters_list.append(Game.away_abbreviation.in_(away_abbreviations))
+        filters_list.append(match_values(Game.away_abbreviation, away_abbreviations))
 
     # Filter by HOME TEAM DIVISION and AWAY TEAM DIVISION
-    home_divisions = normalize_to_list(filters.home_division)
-    away_divisions = normalize_to_list(filters.away_division)
+    home_divisions = filters.home_division or []
+    away_divisions = filters.away_division or []
 
     if home_divisions and away_divisions:
         filters_list.append(
             and_(
-                Game.home_division.in_(home_divisions),
-                Game.away_division.in_(away_divisions)
+                match_values(Game.home_division, home_divisions),
+                match_values(Game.away_division, away_divisions)
             )
         )
     elif home_divisions:
-        filters_list.append(Game.home_division.in_(home_divisions))
+        filters_list.append(match_values(Game.home_division, home_divisions))
     elif away_divisions:
-        filters_list.append(Game.away_division.in_(away_divisions))
+        filters_list.append(match_values(Game.away_division, away_divisions))
 
     # Filter by DIVISIONAL
     if filters.divisional is not None:
@@ -1437,47 +1556,38 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
 
     # Filter by HOME SCORE
     if filters.home_score:
-        if isinstance(filters.home_score, int):
-            filters_list.append(Game.home_score == filters.home_score)
-        else:
-            filters_list.append(Game.home_score.in_(filters.home_score))
+        filters_list.append(match_values(Game.home_score, filters.home_score))
 
     # Filter by a HOME SCORE RANGE
-    if filters.min_home_score and filters.max_home_score:
+    if filters.min_home_score is not None and filters.max_home_score is not None:
         filters_list.append(Game.home_score.between(filters.min_home_score, filters.max_home_score))
-    elif filters.min_home_score:
+    elif filters.min_home_score is not None:
         filters_list.append(Game.home_score >= filters.min_home_score)
-    elif filters.max_home_score:
+    elif filters.max_home_score is not None:
         filters_list.append(Game.home_score <= filters.max_home_score)
 
     # Filter by AWAY SCORE
     if filters.away_score:
-        if isinstance(filters.away_score, int):
-            filters_list.append(Game.away_score == filters.away_score)
-        else:
-            filters_list.append(Game.away_score.in_(filters.away_score))
+        filters_list.append(match_values(Game.away_score, filters.away_score))
 
     # Filter by a AWAY SCORE RANGE
-    if filters.min_away_score and filters.max_away_score:
+    if filters.min_away_score is not None and filters.max_away_score is not None:
         filters_list.append(Game.away_score.between(filters.min_away_score, filters.max_away_score))
-    elif filters.min_away_score:
+    elif filters.min_away_score is not None:
         filters_list.append(Game.away_score >= filters.min_away_score)
-    elif filters.max_away_score:
+    elif filters.max_away_score is not None:
         filters_list.append(Game.away_score <= filters.max_away_score)
 
     # Filter by COMBINED SCORE
     if filters.combined_score:
-        if isinstance(filters.combined_score, int):
-            filters_list.append(Game.combined_score == filters.combined_score)
-        else:
-            filters_list.append(Game.combined_score.in_(filters.combined_score))
+        filters_list.append(match_values(Game.combined_score, filters.combined_score))
     
     # Filter by a COMBINED SCORE RANGE
-    if filters.min_combined_score and filters.max_combined_score:
+    if filters.min_combined_score is not None and filters.max_combined_score is not None:
         filters_list.append(Game.combined_score.between(filters.min_combined_score, filters.max_combined_score))
-    elif filters.min_combined_score:
+    elif filters.min_combined_score is not None:
         filters_list.append(Game.combined_score >= filters.min_combined_score)
-    elif filters.max_combined_score:
+    elif filters.max_combined_score is not None:
         filters_list.append(Game.combined_score <= filters.max_combined_score)
 
     # Filter by TIE
@@ -1486,91 +1596,70 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
 
     # Filter by WINNER
     if filters.winner:
-        if isinstance(filters.winner, str):
-            filters_list.append(Game.winner == filters.winner)
-        else:
-            filters_list.append(Game.winner.in_(filters.winner))
+        filters_list.append(match_values(Game.winner, filters.winner))
 
     # Filter by LOSER
     if filters.loser:
-        if isinstance(filters.loser, str):
-            filters_list.append(Game.loser == filters.loser)
-        else:
-            filters_list.append(Game.loser.in_(filters.loser))
+        filters_list.append(match_values(Game.loser, filters.loser))
 
     # Filter by SPREAD
     if filters.spread:
-        if isinstance(filters.spread, float):
-            filters_list.append(Game.spread == filters.spread)
-        else:
-            filters_list.append(Game.spread.in_(filters.spread))
+        filters_list.append(match_values(Game.spread, filters.spread))
 
     # Filter by a SPREAD RANGE
-    if filters.min_spread and filters.max_spread:
+    if filters.min_spread is not None and filters.max_spread is not None:
         filters_list.append(Game.spread.between(filters.min_spread, filters.max_spread))
-    elif filters.min_spread:
+    elif filters.min_spread is not None:
         filters_list.append(Game.spread >= filters.min_spread)
-    elif filters.max_spread:
+    elif filters.max_spread is not None:
         filters_list.append(Game.spread <= filters.max_spread)
 
     # Filter by HOME SPREAD
     if filters.home_spread:
-        if isinstance(filters.home_spread, float):
-            filters_list.append(Game.home_spread == filters.home_spread)
-        else:
-            filters_list.append(Game.home_spread.in_(filters.home_spread))
+        filters_list.append(match_values(Game.home_spread, filters.home_spread))
 
     # Filter by a HOME SPREAD RANGE
-    if filters.min_home_spread and filters.max_home_spread:
+    if filters.min_home_spread is not None and filters.max_home_spread is not None:
         filters_list.append(Game.home_spread.between(filters.min_home_spread, filters.max_home_spread))
-    elif filters.min_home_spread:
+    elif filters.min_home_spread is not None:
         filters_list.append(Game.home_spread >= filters.min_home_spread)
-    elif filters.max_home_spread:
+    elif filters.max_home_spread is not None:
         filters_list.append(Game.home_spread <= filters.max_home_spread)
 
     # Filter by HOME SPREAD RESULT
     if filters.home_spread_result:
-        if isinstance(filters.home_spread_result, int):
-            filters_list.append(Game.home_spread_result == filters.home_spread_result)
-        else:
-            filters_list.append(Game.home_spread_result.in_(filters.home_spread_result))
+        filters_list.append(match_values(Game.home_spread_result, filters.home_spread_result))
 
     # Filter by a HOME SPREAD RESULT RANGE
-    if filters.min_home_spread_result and filters.max_home_spread_result:
+    if filters.min_home_spread_result is not None and filters.max_home_spread_result is not None:
         filters_list.append(Game.home_spread_result.between(filters.min_home_spread_result, filters.max_home_spread_result))
-    elif filters.min_home_spread_result:
+    elif filters.min_home_spread_result is not None:
         filters_list.append(Game.home_spread_result >= filters.min_home_spread_result)
-    elif filters.max_home_spread_result:
+    elif filters.max_home_spread_result is not None:
         filters_list.append(Game.home_spread_result <= filters.max_home_spread_result)
 
     # Filter by AWAY SPREAD
     if filters.away_spread:
-        if isinstance(filters.away_spread, float):
-            filters_list.append(Game.away_spread == filters.away_spread)
-        else:
-            filters_list.append(Game.away_spread.in_(filters.away_spread))
+        filters_list.append(match_values(Game.away_spread, filters.away_spread))
 
     # Filter by a AWAY SPREAD RANGE
-    if filters.min_away_spread and filters.max_away_spread:
+    if filters.min_away_spread is not None and filters.max_away_spread is not None:
         filters_list.append(Game.away_spread.between(filters.min_away_spread, filters.max_away_spread))
-    elif filters.min_away_spread:
+    elif filters.min_away_spread is not None:
         filters_list.append(Game.away_spread >= filters.min_away_spread)
-    elif filters.max_away_spread:
+    elif filters.max_away_spread is not None:
         filters_list.append(Game.away_spread <= filters.max_away_spread)
 
     # Filter by AWAY SPREAD RESULT
     if filters.away_spread_result:
-        if isinstance(filters.away_spread_result, int):
-            filters_list.append(Game.away_spread_result == filters.away_spread_result)
-        else:
-            filters_list.append(Game.away_spread_result.in_(filters.away_spread_result))
+        filters_list.append(match_values(Game.away_spread_result, filters.away_spread_result))
 
     # Filter by a AWAY SPREAD RESULT RANGE
-    if filters.min_away_spread_result and filters.max_away_spread_result:
+    if filters.min_away_spread_result is not None and filters.max_away_spread_result is not None:
         filters_list.append(Game.away_spread_result.between(filters.min_away_spread_result, filters.max_away_spread_result))
-    elif filters.min_away_spread_result:
+    elif filters.min_away_spread_result is not None:
         filters_list.append(Game.away_spread_result >= filters.min_away_spread_result)
-    elif filters.max_away_spread_result:
+    elif filters.max_away_spread_result is not None:
         filters_list.append(Game.away_spread_result <= filters.max_away_spread_result)
 
     # Filter by SPREAD PUSH
@@ -1583,17 +1672,14 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
 
     # Filter by TOTAL
     if filters.total:
-        if isinstance(filters.total, float):
-            filters_list.append(Game.total == filters.total)
-        else:
-            filters_list.append(Game.total.in_(filters.total))
+        filters_list.append(match_values(Game.total, filters.total))
 
     # Filter by a TOTAL RANGE
-    if filters.min_total and filters.max_total:
+    if filters.min_total is not None and filters.max_total is not None:
         filters_list.append(Game.total.between(filters.min_total, filters.max_total))
-    elif filters.min_total:
+    elif filters.min_total is not None:
         filters_list.append(Game.total >= filters.min_total)
-    elif filters.max_total:
+    elif filters.max_total is not None:
         filters_list.append(Game.total <= filters.max_total)
 
     # Filter by TOTAL PUSH
@@ -1672,9 +1758,13 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
 
     # Apply filters to the query
     if filters_list:
-        query = query.filter(*filters_list)
-
-    total_count = query.order_by(None).count()
+        # Count the matching games with a window function so the total comes back with the page in one round-trip
+        query = db.query(Game, func.count().over().label("total_count")).filter(*filters_list)
+        total_count = None
+    else:
+        # Unfiltered requests read the row count from table statistics instead of scanning every game
+        query = db.query(Game)
+        total_count = estimate_games_count(db)
 
     # Sorting
     valid_sort_fields = {c_attr.key for c_attr in inspect(Game).mapper.column_attrs}
@@ -1728,14 +1818,26 @@ def get_games(filters: GameFilter, db: Session = Depends(get_connection)):
     if filters.offset:
         query = query.offset(filters.offset)
 
-    games = query.all()
+    rows = query.all()
+    if total_count is None:
+        games = [row.Game for row in rows]
+        total_count = rows[0].total_count if rows else 0
+    else:
+        games = rows
 
     if not games:
-        return []
-    return {
-        "limit": filters.limit,
-        "offset": filters.offset,
-        "count": len(games),
-        "total_count": total_count,
-        "results": games,
-    }
\ No newline at end of file
+        result = dumps([])
+    else:
+        # Serialize with orjson directly instead of FastAPI's jsonable_encoder pass
+        result = dumps({
+            "limit": filters.limit,
+            "offset": filters.offset,
+            "count": len(games),
+            "total_count": total_count,
+            "results": [row_to_dict(game, GAME_COLUMNS) for game in games],
+        })
+
+    # Cache the serialized result
+    set_games_cache(cache_key, result)
+
+    return json_response(result)
\ No newline at end of file
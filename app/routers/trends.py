@@ -1,29 +1,71 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import case, and_, or_
-from sqlalchemy.inspection import inspect
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Union, Literal
+import sys
+import logging
+import base64
+import binascii
+import orjson
+from functools import lru_cache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Column, case, and_, or_, func, select, false, null
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.sql.visitors import replacement_traverse
+from pydantic import BaseModel, Discriminator, Field, Tag, field_validator, model_validator
+from typing import Annotated, Any, List, Optional, Union, Literal
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from app.models.trend import Trend
-from app.database.connection import get_connection
+from app.models.trend_count import TrendCount
+from app.database.connection import get_async_connection
+from app.responses import dumps, json_response
 from app.enums.trend_enums import CategoryEnum, MonthEnum, DayOfWeekEnum
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
-MONTH_MAPPING = {
-    "January": 1,
-    "February": 2,
-    "March": 3,
-    "April": 4,
-    "May": 5,
-    "June": 6,
-    "July": 7,
-    "August": 8,
-    "September": 9,
-    "October": 10,
-    "November": 11,
-    "December": 12,
-}
+# Response columns; month_num is a database-generated helper used only in WHERE and ORDER BY
+TREND_COLUMNS = tuple(key for key in Trend.__table__.columns.keys() if key != "month_num")
+# Rows fetched from the server-side cursor per streamed chunk
+STREAM_BATCH_SIZE = 500
+SORT_FIELDS = frozenset(TREND_COLUMNS)
+
+# Month name -> calendar number, taken from MonthEnum's January..December declaration order
+MONTH_MAPPING = {month.value: number for number, month in enumerate(MonthEnum, start=1)}
+
+# Calendar-order sort key for day_of_week, with NULLs after every named day
+DAY_SORT_CASE = case(
+    *((Trend.day_of_week == day.value, number) for number, day in enumerate(DayOfWeekEnum, start=1)),
+    (Trend.day_of_week == None, 8),
+    else_=9
+)
+
+# Allowed filter values, built once at import rather than on every request. Members are
+# interned, and validators intern the values they accept, so later comparisons against
+# these sets and the query parameters built from them can short-circuit on identity.
+CATEGORY_VALUES = frozenset(map(sys.intern, CategoryEnum._value2member_map_))
+MONTH_VALUES = frozenset(map(sys.intern, MonthEnum._value2member_map_))
+DAY_OF_WEEK_VALUES = frozenset(map(sys.intern, DayOfWeekEnum._value2member_map_))
+# Stored "X or less"/"X or more" strings for each or_less/or_more number, so filters look them up
+SPREAD_OR_LESS = {i: sys.intern(f"{i} or less") for i in range(1, 15)}
+SPREAD_OR_MORE = {i: sys.intern(f"{i} or more") for i in range(1, 15)}
+SPREAD_VALUES = frozenset(map(sys.intern,
+    {f"{i * 0.5:.1f}" for i in range(0, 55)}
+    | set(SPREAD_OR_LESS.values())
+    | set(SPREAD_OR_MORE.values())
+    | {"None"}
+))
+TOTAL_STEP_VALUES = frozenset(range(30, 65, 5))
+TOTAL_OR_LESS = {i: sys.intern(f"{i} or less") for i in TOTAL_STEP_VALUES}
+TOTAL_OR_MORE = {i: sys.intern(f"{i} or more") for i in TOTAL_STEP_VALUES}
+TOTAL_VALUES = frozenset(map(sys.intern,
+    set(TOTAL_OR_LESS.values())
+    | set(TOTAL_OR_MORE.values())
+    | {"None"}
+))
+
+# Seasons in chronological order; the handler slices this for since_or_* ranges
+VALID_SEASONS = tuple(sys.intern(f"since {year}-{year + 1}") for year in range(2006, 2026))
+VALID_SEASONS_SET = frozenset(VALID_SEASONS)
+SEASON_INDEX = {season: index for index, season in enumerate(VALID_SEASONS)}
 
 ##################################
 ######## FILTER OBJECTS ##########
@@ -61,6 +103,30 @@ class TotalFilter(BaseModel):
         description="Filter for 'X or more' total values, must be 30–60 in steps of 5, e.g. 40 → '40 or more' or [35, 40, 45] → ['35 or more', '40 or more', '45 or more']"
     )
 
+def null_or_filter(value: Any) -> str:
+    """
+    Pick the union member for a spread or total filter from the raw input.
+
+    Args:
+        value: The submitted spread/total value
+
+    Returns:
+        'none' for strings (only 'None' is valid), 'filter' for structured filters
+    """
+    return "none" if isinstance(value, str) else "filter"
+
+
+# Spread/total are either the string 'None' or a structured filter; the discriminator
+# validates against the one matching member instead of trying each in turn
+SpreadField = Annotated[
+    Union[Annotated[Literal["None"], Tag("none")], Annotated[SpreadFilter, Tag("filter")]],
+    Discriminator(null_or_filter)
+]
+TotalField = Annotated[
+    Union[Annotated[Literal["None"], Tag("none")], Annotated[TotalFilter, Tag("filter")]],
+    Discriminator(null_or_filter)
+]
+
 class SeasonFilter(BaseModel):
     exact: Optional[Union[str, List[str]]] = Field(
         default=None,
@@ -75,38 +141,147 @@ class SeasonFilter(BaseModel):
         description="Return trends from this seasons and earlier"
     )
 
+def encode_cursor(values: list) -> str:
+    """
+    Encode the sort-key values of a row as an opaque pagination cursor.
+
+    Args:
+        values: The row's sort-key values followed by its id
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    return base64.urlsafe_b64encode(dumps(values)).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Decode a pagination cursor produced by encode_cursor.
+
+    Args:
+        cursor: The cursor string sent by the client
+
+    Returns:
+        The sort-key values followed by the row id
+
+    Raises:
+        ValueError: If the cursor is not a valid encoded list
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeEncodeError, orjson.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(values, list) or not values:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
+
+
+def keyset_condition(sort_keys: list, values: list):
+    """
+    Build the WHERE clause selecting rows that sort strictly after a cursor row.
+
+    The comparison is expanded per key so mixed asc/desc orders work, and matches the
+    explicit NULL placement get_trends sorts with (last for ascending, first for descending).
+
+    Args:
+        sort_keys: (expression, descending) pairs in ORDER BY order, ending with the id
+        values: The cursor row's value for each sort key
+
+    Returns:
+        SQLAlchemy clause for the rows after the cursor
+    """
+    clauses = []
+    equal_so_far = []
+    for (expr, descending), value in zip(sort_keys, values):
+        if value is None:
+            after = expr.is_not(None) if descending else false()
+            same = expr.is_(None)
+        elif isinstance(value, bool):
+            # Booleans only support IS comparisons; False sorts before True
+            beyond = expr.is_(not value) if value == descending else false()
+            after = beyond if descending else or_(beyond, expr.is_(None))
+            same = expr.is_(value)
+        else:
+            after = expr < value if descending else or_(expr > value, expr.is_(None))
+            same = expr == value
+        clauses.append(and_(*equal_so_far, after))
+        equal_so_far.append(same)
+    return or_(*clauses)
+
+
+def _make_int_range_validator(label: str, lo: int, hi: int):
+    """
+    Build a validator accepting an int or list of ints within [lo, hi].
+
+    Args:
+        label: Field label used in error messages (e.g. "Wins")
+        lo: Minimum allowed value (inclusive)
+        hi: Maximum allowed value (inclusive)
+
+    Returns:
+        A classmethod-style validator for use with field_validator
+    """
+    def validate(cls, value):
+        if type(value) is int:
+            if not lo <= value <= hi:
+                raise ValueError(f"{label} must be an integer between {lo} and {hi}")
+        elif type(value) is list:
+            for v in value:
+                if type(v) is not int or not lo <= v <= hi:
+                    raise ValueError(f"Each value in {label.lower()} list must be an integer between {lo} and {hi}")
+        elif value is not None:
+            raise ValueError(f"{label} must be an int or a list of ints between {lo} and {hi}")
+        return value
+
+    return validate
+
+
 class TrendFilter(BaseModel):
 
     ##################################
     ###### PAGINATION FILTERS ########
     ##################################
 
-    limit: Optional[int] = Field(
+    # VALIDATE LIMIT is between 1 and 5000000 and OFFSET is greater than or equal to 0
+    limit: int = Field(
         5000,
+        ge=1,
+        le=5000000,
         description=(
             "Limit the number of results returned. "
             "Example: 100."
         )
     )
-    offset: Optional[int] = Field(
+    offset: int = Field(
         0,
+        ge=0,
         description=(
             "Offset the results returned. "
             "Example: 0."
         )
     )
+    after: Optional[str] = Field(
+        None,
+        description=(
+            "Keyset pagination cursor: the 'next_cursor' value from the previous page. "
+            "Results continue after that row and 'offset' is ignored; 'sort_by' must match the earlier request."
+        )
+    )
+    include_total: bool = Field(
+        True,
+        strict=True,
+        description=(
+            "Whether to count every matching row for 'total_count'. "
+            "Set to false to skip the count; 'total_count' is then null."
+        )
+    )
 
-    # VALIDATE LIMIT is between 1 and 5000000
-    @validator("limit", pre=True)
-    def validate_limit(cls, value):
-        if not isinstance(value, int) or not (1 <= value <= 5000000):
-            raise ValueError("Limit must be an integer between 1 and 5000000")
-        return value
-    # VALIDATE OFFSET is greater than 0
-    @validator("offset", pre=True)
-    def validate_offset(cls, value):
-        if not isinstance(value, int) or value < 0:
-            raise ValueError("Offset must be an integer greater than or equal to 0")
+    # VALIDATE AFTER is a cursor produced by a previous response
+    @field_validator("after")
+    @classmethod
+    def validate_after(cls, value):
+        if value is not None:
+            decode_cursor(value)
         return value
     
     ##################################
@@ -123,30 +298,27 @@ class TrendFilter(BaseModel):
     )
 
     # VALIDATE TREND IDs are in a comma separated list of filters
-    @validator("trend_id", pre=True)
+    @field_validator("trend_id", mode="before")
+    @classmethod
     def validate_trend_id(cls, value):
         if value is None:
             return value
 
         if isinstance(value, str):
-            values = [v.strip() for v in value.split(",")]
-            if len(values) != 7:
+            if value.count(",") != 6:
                 raise ValueError(
                     "If trend_id is a string, it must have exactly 7 comma-separated values."
                 )
-            print("TREND ID is a single string.")
             return value
 
         elif isinstance(value, list):
             for v in value:
                 if not isinstance(v, str):
                     raise ValueError("All items in trend_id list must be strings.")
-                values = [x.strip() for x in v.split(",")]
-                if len(values) != 7:
+                if v.count(",") != 6:
                     raise ValueError(
-                        f"Each trend_id in the list must have exactly 7 comma-separated values. Got: {values}"
+                        f"Each trend_id in the list must have exactly 7 comma-separated values. Got: {v}"
                     )
-            print("TREND ID is a list of strings.")
             return value
 
         raise ValueError("trend_id must be either a string or a list of strings.")
@@ -166,26 +338,34 @@ class TrendFilter(BaseModel):
     )
 
     # VALIDATE CATEGORY is in the CategoryEnum format
-    @validator("category", pre=True)
+    @field_validator("category", mode="before")
+    @classmethod
     def validate_category(cls, value):
         if value is None:
             return value
 
         if isinstance(value, str):
-            # Validate a single category
+            # Validate a single category, skipping the lowercase copy when already canonical
+            if value in CATEGORY_VALUES:
+                return sys.intern(value)
             value = value.lower()
-            if value not in CategoryEnum._value2member_map_:
+            if value not in CATEGORY_VALUES:
                 raise ValueError(
                     f"Invalid category: {value}. Must be one of {list(CategoryEnum._value2member_map_.keys())}."
                 )
+            return sys.intern(value)
         if isinstance(value, list):
             # Validate a list of categories
+            normalized = []
             for v in value:
-                v = v.lower()
-                if v not in CategoryEnum._value2member_map_:
-                    raise ValueError(
-                        f"Invalid category: {v}. Must be one of {list(CategoryEnum._value2member_map_.keys())}."
-                    )
+                if v not in CATEGORY_VALUES:
+                    v = v.lower()
+                    if v not in CATEGORY_VALUES:
+                        raise ValueError(
+                            f"Invalid category: {v}. Must be one of {list(CategoryEnum._value2member_map_.keys())}."
+                        )
+                normalized.append(sys.intern(v))
+            return normalized
         return value
     
 
@@ -210,34 +390,40 @@ class TrendFilter(BaseModel):
     )
 
     # VALIDATES MONTHS are in the MonthEnum format
-    @validator("month", pre=True)
+    @field_validator("month", mode="before")
+    @classmethod
     def validate_month(cls, value):
         if value == "None":
             return "None"
         if isinstance(value, str):
+            if value in MONTH_VALUES:
+                return sys.intern(value)
             value = value.capitalize()
-            if value not in MonthEnum._value2member_map_:
+            if value not in MONTH_VALUES:
                 raise ValueError(f"{value} must be one of {list(MonthEnum._value2member_map_.keys())} or 'None'")
-            return value
+            return sys.intern(value)
         if isinstance(value, list):
             normalized = []
             for v in value:
-                v_cap = v.capitalize() if isinstance(v, str) else v
-                if v_cap != "None" and v_cap not in MonthEnum._value2member_map_:
+                v_cap = v.capitalize() if isinstance(v, str) and v not in MONTH_VALUES else v
+                if v_cap != "None" and v_cap not in MONTH_VALUES:
                     raise ValueError(f"Each month in {value} must be one of {list(MonthEnum._value2member_map_.keys())} or 'None'")
-                normalized.append(v_cap)
+                normalized.append(sys.intern(v_cap))
             return normalized
         return value
     
-    @validator("start_month", "end_month", pre=True)
+    @field_validator("start_month", "end_month", mode="before")
+    @classmethod
     def validate_start_end_month(cls, value):
         if value == "None":
             raise ValueError(f"{value} cannot be 'None'")
         if isinstance(value, str):
+            if value in MONTH_VALUES:
+                return sys.intern(value)
             value = value.capitalize()
-            if value not in MonthEnum._value2member_map_:
+            if value not in MONTH_VALUES:
                 raise ValueError(f"{value} must be one of {list(MonthEnum._value2member_map_.keys())}")
-            return value
+            return sys.intern(value)
         return value
     
 
@@ -254,25 +440,23 @@ class TrendFilter(BaseModel):
     )
     
     # VALIDATE DAY OF WEEK are in the DayOfWeekEnum format
-    @validator("day_of_week", pre=True)
+    @field_validator("day_of_week", mode="before")
+    @classmethod
     def validate_day_of_week(cls, value):
-        valid_days = set(DayOfWeekEnum._value2member_map_.keys())
-
-        def is_valid_day(day):
-            return day in valid_days or day == "None"
-
         if isinstance(value, str):
+            if value in DAY_OF_WEEK_VALUES:
+                return sys.intern(value)
             value = value.capitalize()
-            if not is_valid_day(value):
-                raise ValueError(f"{value} must be one of {list(valid_days)} or 'None'")
-            return value
+            if value not in DAY_OF_WEEK_VALUES and value != "None":
+                raise ValueError(f"{value} must be one of {list(DayOfWeekEnum._value2member_map_.keys())} or 'None'")
+            return sys.intern(value)
 
         if isinstance(value, list):
-            value = [str(day).capitalize() if isinstance(day, str) else day for day in value]
+            value = [day.capitalize() if isinstance(day, str) and day not in DAY_OF_WEEK_VALUES else day for day in value]
             for day in value:
-                if not is_valid_day(day):
-                    raise ValueError(f"Each day in {value} must be one of {list(valid_days)} or 'None'")
-            return value
+                if day not in DAY_OF_WEEK_VALUES and day != "None":
+                    raise ValueError(f"Each day in {value} must be one of {list(DayOfWeekEnum._value2member_map_.keys())} or 'None'")
+            return [sys.intern(day) for day in value]
 
         return value
     
@@ -287,7 +471,8 @@ class TrendFilter(BaseModel):
     )
 
     # VALIDATE DIVISIONAL is a boolean, "None", or a list of these
-    @validator("divisional", pre=True)
+    @field_validator("divisional", mode="before")
+    @classmethod
     def validate_divisional(cls, value):
         if value is None:
             return None
@@ -333,7 +518,8 @@ class TrendFilter(BaseModel):
     ####### SPREAD FILTERS ##########
     #################################
 
-    spread: Optional[Union[SpreadFilter, str]] = Field(
+    # 'None' is tried before the model so the null-spread case skips SpreadFilter construction
+    spread: Optional[SpreadField] = Field(
         None,
         description=(
             "Filter by spread. Can be 'None' to get rows where spread is null, or a structured filter like "
@@ -344,44 +530,38 @@ class TrendFilter(BaseModel):
     )
 
     # VALIDATE SPREAD is in the SPREAD_VALUES format
-    @validator("spread")
+    @field_validator("spread")
+    @classmethod
     def validate_spread(cls, spread):
-        if spread:
-            SPREAD_VALUES = {f"{x:.1f}" for x in [i * 0.5 for i in range(0, 55)]}
-            SPREAD_VALUES.update({f"{i} or less" for i in range(1, 15)})
-            SPREAD_VALUES.update({f"{i} or more" for i in range(1, 15)})
-            SPREAD_VALUES.add("None")
-
-            if isinstance(spread, str):
-                if spread == "None":
-                    return "None"
-                raise ValueError(
-                    f"Invalid spread value: '{spread}'. Allowed values are structured objects or the string 'None'."
-                )
+        match spread:
+            case None | "None":
+                return spread
+            case SpreadFilter():
+                # Normalize every sub-filter to a list so the query builder never re-branches
+                match spread.exact:
+                    case str():
+                        spread.exact = [spread.exact]
+                match spread.or_less:
+                    case int():
+                        spread.or_less = [spread.or_less]
+                match spread.or_more:
+                    case int():
+                        spread.or_more = [spread.or_more]
 
-            elif isinstance(spread, SpreadFilter):
                 # exact values
-                if spread.exact:
-                    exact_list = [spread.exact] if isinstance(spread.exact, str) else spread.exact
-                    for val in exact_list:
-                        if val not in SPREAD_VALUES:
-                            raise ValueError(
-                                f"Invalid spread value in 'exact': '{val}'. Allowed: '0.0'-'27.0' by 0.5, 'X or less/more' (1-14), or 'None'."
-                            )
-
-                # or_less values - can be int or list of ints
-                if spread.or_less is not None:
-                    or_less_list = [spread.or_less] if isinstance(spread.or_less, int) else spread.or_less
-                    for val in or_less_list:
-                        if not (1 <= val <= 14):
-                            raise ValueError(f"'or_less' value {val} must be between 1 and 14")
-
-                # or_more values - can be int or list of ints
-                if spread.or_more is not None:
-                    or_more_list = [spread.or_more] if isinstance(spread.or_more, int) else spread.or_more
-                    for val in or_more_list:
-                        if not (1 <= val <= 14):
-                            raise ValueError(f"'or_more' value {val} must be between 1 and 14")
+                for val in spread.exact or ():
+                    if val not in SPREAD_VALUES:
+                        raise ValueError(
+                            f"Invalid spread value in 'exact': '{val}'. Allowed: '0.0'-'27.0' by 0.5, 'X or less/more' (1-14), or 'None'."
+                        )
+
+                # or_less / or_more values
+                for val in spread.or_less or ():
+                    if not (1 <= val <= 14):
+                        raise ValueError(f"'or_less' value {val} must be between 1 and 14")
+                for val in spread.or_more or ():
+                    if not (1 <= val <= 14):
+                        raise ValueError(f"'or_more' value {val} must be between 1 and 14")
 
         return spread
     
@@ -390,7 +570,7 @@ class TrendFilter(BaseModel):
     ####### TOTAL FILTERS ###########
     #################################
 
-    total: Optional[Union[TotalFilter, str]] = Field(
+    total: Optional[TotalField] = Field(
         None,
         description=(
             "Filter by total. Can be 'None' for null totals, or a filter like "
@@ -399,44 +579,37 @@ class TrendFilter(BaseModel):
         )
     )
 
-    @validator("total")
+    @field_validator("total")
+    @classmethod
     def validate_total(cls, total):
-        if total:
-            TOTAL_VALUES = {f"{i} or less" for i in range(30, 65, 5)}
-            TOTAL_VALUES.update({f"{i} or more" for i in range(30, 65, 5)})
-            TOTAL_VALUES.add("None")
-
-            if isinstance(total, str):
-                if total == "None":
-                    return "None"
-                raise ValueError(
-                    f"Invalid total value: '{total}'. Allowed values are structured filters or 'None'."
-                )
-
-            elif isinstance(total, TotalFilter):
-                if total.exact:
-                    exact_list = [total.exact] if isinstance(total.exact, str) else total.exact
-                    for val in exact_list:
-                        if val not in TOTAL_VALUES:
-                            raise ValueError(
-                                f"Invalid total value in 'exact': '{val}'. Allowed values: 30–60 in steps of 5 for 'X or less'/'X or more', or 'None'."
-                            )
-
-                # or_less values - can be int or list of ints
-                if total.or_less is not None:
-                    or_less_list = [total.or_less] if isinstance(total.or_less, int) else total.or_less
-                    for val in or_less_list:
-                        if val not in range(30, 65, 5):
-                            raise ValueError(f"'or_less' value {val} must be one of: 30, 35, 40, 45, 50, 55, 60")
-
-                # or_more values - can be int or list of ints
-                if total.or_more is not None:
-                    or_more_list = [total.or_more] if isinstance(total.or_more, int) else total.or_more
-                    for val in or_more_list:
-                        if val not in range(30, 65, 5):
-                            raise ValueError(f"'or_more' value {val} must be one of: 30, 35, 40, 45, 50, 55, 60")
-
-        return total
+        match total:
+            case None | "None":
+                return total
+            case TotalFilter():
+                # Normalize every sub-filter to a list so the query builder never re-branches
+                match total.exact:
+                    case str():
+                        total.exact = [total.exact]
+                match total.or_less:
+                    case int():
+                        total.or_less = [total.or_less]
+                match total.or_more:
+                    case int():
+                        total.or_more = [total.or_more]
+
+                for val in total.exact or ():
+                    if val not in TOTAL_VALUES:
+                        raise ValueError(
+                            f"Invalid total value in 'exact': '{val}'. Allowed values: 30–60 in steps of 5 for 'X or less'/'X or more', or 'None'."
+                        )
+
+                # or_less / or_more values
+                for val in total.or_less or ():
+                    if val not in TOTAL_STEP_VALUES:
+                        raise ValueError(f"'or_less' value {val} must be one of: 30, 35, 40, 45, 50, 55, 60")
+                for val in total.or_more or ():
+                    if val not in TOTAL_STEP_VALUES:
+                        raise ValueError(f"'or_more' value {val} must be one of: 30, 35, 40, 45, 50, 55, 60")
 
         return total
     
@@ -454,24 +627,23 @@ class TrendFilter(BaseModel):
         )
     )
 
-    @validator("seasons")
+    @field_validator("seasons")
+    @classmethod
     def validate_season(cls, seasons):
         if seasons:
-            VALID_SEASONS = [f"since {year}-{year + 1}" for year in range(2006, 2026)]
-
             # Validate exact
             if seasons.exact:
                 exact_list = [seasons.exact] if isinstance(seasons.exact, str) else seasons.exact
                 for s in exact_list:
-                    if s not in VALID_SEASONS:
-                        raise ValueError(f"Invalid seasons in 'exact': '{s}'. Must be one of {VALID_SEASONS}.")
+                    if s not in VALID_SEASONS_SET:
+                        raise ValueError(f"Invalid seasons in 'exact': '{s}'. Must be one of {list(VALID_SEASONS)}.")
                 seasons.exact = exact_list
 
             # Validate since_or_later / since_or_earlier
-            if seasons.since_or_later and seasons.since_or_later not in VALID_SEASONS:
-                raise ValueError(f"'since_or_later' value '{seasons.since_or_later}' is not valid. Must be one of {VALID_SEASONS}.")
-            if seasons.since_or_earlier and seasons.since_or_earlier not in VALID_SEASONS:
-                raise ValueError(f"'since_or_earlier' value '{seasons.since_or_earlier}' is not valid. Must be one of {VALID_SEASONS}.")
+            if seasons.since_or_later and seasons.since_or_later not in VALID_SEASONS_SET:
+                raise ValueError(f"'since_or_later' value '{seasons.since_or_later}' is not valid. Must be one of {list(VALID_SEASONS)}.")
+            if seasons.since_or_earlier and seasons.since_or_earlier not in VALID_SEASONS_SET:
+                raise ValueError(f"'since_or_earlier' value '{seasons.since_or_earlier}' is not valid. Must be one of {list(VALID_SEASONS)}.")
 
         return seasons
 
@@ -486,29 +658,23 @@ class TrendFilter(BaseModel):
     )
     min_wins: Optional[int] = Field(
         None,
+        strict=True,
+        ge=1,
+        le=5000,
         description="Minimum number of wins (inclusive), between 1 and 5000."
     )
     max_wins: Optional[int] = Field(
         None,
+        strict=True,
+        ge=1,
+        le=5000,
         description="Maximum number of wins (inclusive), between 1 and 5000."
     )
 
     # VALIDATE WINS is between 1 and 5000
-    @validator("wins", "min_wins", "max_wins", pre=True)
-    def validate_wins(cls, value):
-        def is_valid(val):
-            return isinstance(val, int) and 1 <= val <= 5000
-
-        if isinstance(value, int):
-            if not is_valid(value):
-                raise ValueError("Wins must be an integer between 1 and 5000")
-        elif isinstance(value, list):
-            for v in value:
-                if not is_valid(v):
-                    raise ValueError("Each value in wins list must be an integer between 1 and 5000")
-        elif value is not None:
-            raise ValueError("Wins must be an int or a list of ints between 1 and 5000")
-        return value
+    validate_wins = field_validator("wins", mode="before")(
+        _make_int_range_validator("Wins", 1, 5000)
+    )
     
 
     ###################################
@@ -521,29 +687,23 @@ class TrendFilter(BaseModel):
     )
     min_losses: Optional[int] = Field(
         None,
+        strict=True,
+        ge=1,
+        le=5000,
         description="Minimum number of losses (inclusive), between 1 and 5000."
     )
     max_losses: Optional[int] = Field(
         None,
+        strict=True,
+        ge=1,
+        le=5000,
         description="Maximum number of losses (inclusive), between 1 and 5000."
     )
 
     # VALIDATE LOSSES is between 1 and 5000
-    @validator("losses", "min_losses", "max_losses", pre=True)
-    def validate_losses(cls, value):
-        def is_valid(val):
-            return isinstance(val, int) and 1 <= val <= 5000
-
-        if isinstance(value, int):
-            if not is_valid(value):
-                raise ValueError("Losses must be an integer between 1 and 5000")
-        elif isinstance(value, list):
-            for v in value:
-                if not is_valid(v):
-                    raise ValueError("Each value in losses list must be an integer between 1 and 5000")
-        elif value is not None:
-            raise ValueError("Losses must be an int or a list of ints between 1 and 5000")
-        return value
+    validate_losses = field_validator("losses", mode="before")(
+        _make_int_range_validator("Losses", 1, 5000)
+    )
     
 
     ################################
@@ -556,29 +716,23 @@ class TrendFilter(BaseModel):
     )
     min_pushes: Optional[int] = Field(
         None,
+        strict=True,
+        ge=1,
+        le=5000,
         description="Minimum number of pushes (inclusive), between 1 and 5000."
     )
     max_pushes: Optional[int] = Field(
         None,
+        strict=True,
+        ge=1,
+        le=5000,
         description="Maximum number of pushes (inclusive), between 1 and 5000."
     )
 
     # VALIDATE PUSHES is between 1 and 5000
-    @validator("pushes", "min_pushes", "max_pushes", pre=True)
-    def validate_pushes(cls, value):
-        def is_valid(val):
-            return isinstance(val, int) and 1 <= val <= 5000
-
-        if isinstance(value, int):
-            if not is_valid(value):
-                raise ValueError("Pushes must be an integer between 1 and 5000")
-        elif isinstance(value, list):
-            for v in value:
-                if not is_valid(v):
-                    raise ValueError("Each value in pushes list must be an integer between 1 and 5000")
-        elif value is not None:
-            raise ValueError("Pushes must be an int or a list of ints between 1 and 5000")
-        return value
+    validate_pushes = field_validator("pushes", mode="before")(
+        _make_int_range_validator("Pushes", 1, 5000)
+    )
     
     ################################
     ### TOTAL GAMES FILTERS ########
@@ -590,29 +744,23 @@ class TrendFilter(BaseModel):
     )
     min_total_games: Optional[int] = Field(
         None,
+        strict=True,
+        ge=1,
+        le=10000,
         description="Minimum number of total games (inclusive), between 1 and 10000."
     )
     max_total_games: Optional[int] = Field(
         None,
+        strict=True,
+        ge=1,
+        le=10000,
         description="Maximum number of total games (inclusive), between 1 and 10000."
     )
 
     # VALIDATE TOTAL GAMES is between 1 and 10000
-    @validator("total_games", "min_total_games", "max_total_games", pre=True)
-    def validate_total_games(cls, value):
-        def is_valid(val):
-            return isinstance(val, int) and 1 <= val <= 10000
-
-        if isinstance(value, int):
-            if not is_valid(value):
-                raise ValueError("Total games must be an integer between 1 and 10000")
-        elif isinstance(value, list):
-            for v in value:
-                if not is_valid(v):
-                    raise ValueError("Each value in total games list must be an integer between 1 and 10000")
-        elif value is not None:
-            raise ValueError("Total games must be an int or a list of ints between 1 and 10000")
-        return value
+    validate_total_games = field_validator("total_games", mode="before")(
+        _make_int_range_validator("Total games", 1, 10000)
+    )
     
 
     ##################################
@@ -625,15 +773,22 @@ class TrendFilter(BaseModel):
     )
     min_win_percentage: Optional[float] = Field(
         None,
+        strict=True,
+        ge=0,
+        le=100,
         description="Minimum win percentage (inclusive), between 0 and 100."
     )
     max_win_percentage: Optional[float] = Field(
         None,
+        strict=True,
+        ge=0,
+        le=100,
         description="Maximum win percentage (inclusive), between 0 and 100."
     )
 
     # VALIDATE WIN PERCENTAGE is between 0 and 100
-    @validator("win_percentage", "min_win_percentage", "max_win_percentage", pre=True)
+    @field_validator("win_percentage", mode="before")
+    @classmethod
     def validate_win_percentage(cls, value):
         def is_valid(val):
             return isinstance(val, (int, float)) and 0 <= val <= 100
@@ -654,7 +809,7 @@ class TrendFilter(BaseModel):
     ####### SORTING FILTERS ##########
     ##################################
     sort_by: Optional[List[SortField]] = Field(
-        [
+        default_factory=lambda: [
             SortField(field="win_percentage", order="desc"),
             SortField(field="total_games", order="desc"),
         ],
@@ -665,8 +820,13 @@ class TrendFilter(BaseModel):
     )
 
     # VALIDATE SORTING is a list of SortField objects or strings
-    @validator("sort_by", pre=True)
+    @field_validator("sort_by", mode="before")
+    @classmethod
     def validate_sort_by(cls, value):
+        # Already-built SortField lists (e.g. internal callers) need no rebuilding
+        if type(value) is list and value and all(type(v) is SortField for v in value):
+            return value
+
         if not value:
             return None
 
@@ -703,44 +863,49 @@ class TrendFilter(BaseModel):
             "or a list of objects with 'field' and optional 'order' (e.g. [{'field': 'year', 'order': 'desc'}])."
         )
 
-    
 
-@router.post("/trends", summary="Retrieve trends with filters", tags=["Trends"])
-def get_trends(filters: TrendFilter, db: Session = Depends(get_connection)):
-    """
-    Retrieve trends from the database based on the provided filters.
+    ##################################
+    ###### CROSS-FIELD CHECKS ########
+    ##################################
 
-    - **trend_id**: Filter by trend ID(s). The format is a comma separated list of filters for trends in the following order: category,month,day of week,divisional,spread,total,seasons since (Ex: 'home ats,October,Thursday,False,8 or less,40 or less,since 2008-2009').
-    - **category**: Filter by category. Can be a single category or a list of categories from the following options: home outright, away outright, favorite outright, underdog outright, home favorite outright, away underdog outright, away favorite outright, home underdog outright, home ats, away ats, favorite ats, underdog ats, home favorite ats, away underdog ats, away favorite ats, home underdog ats, over, under (Ex: 'home ats' or ['home outright', 'away outright']).
-    - **month**: Filter by month. Can be a single month, a list of months, or 'None' (as a string to filter for NULL values) (Ex: 'January' or ['January', 'February'] or 'None').
-    - **start_month**: Start month for filtering trends (Ex: January).
-    - **end_month**: End month for filtering trends (Ex: December).
-    - **day_of_week**: Filter by day of the week. Can be a single day, a list of days, or 'None' (as a string to filter for NULL values) (Ex: 'Monday' or ['Monday', 'Tuesday'] or 'None').
-    - **divisional**: Filter for divisional trends. Can be True, False, or 'None' (as a string to filter for NULL values) (Ex: True or False or 'None').
-    - **spread**: Filter by spread. Can be 'None' to get rows where spread is null, or a structured filter like {'exact': '3.0'} or {'or_more': 6} or {'or_less': 10} or {'or_more': [7, 8, 9]} or {'or_less': [10, 11, 12]} or {'exact': ['7.5', '1.5'], 'or_more': 12} or {'exact': ['7.0', '10.5'], 'or_less': [3, 4], 'or_more': [10, 11]}.
-    - **total**: Filter by total. Can be 'None' for null totals, or a filter like {'exact': '45 or more'} or {'or_less': 50} or {'or_more': [35, 40]} or {'or_less': [45, 50]} or {'exact': ['30 or more', '40 or less'], 'or_more': 55}, etc.
-    - **seasons**: Filter by seasons. Can be exact seasons(s), or a range like {'since_or_later': 'since 2012-2013'}, {'since_or_earlier': 'since 2020-2021'}, etc or a combination of both.
-    - **wins**: Exact win count or list of win counts (Ex: 20 or [5, 10, 25]).
-    - **min_wins**: Minimum number of wins (inclusive), between 1 and 5000 (Ex: 10).
-    - **max_wins**: Maximum number of wins (inclusive), between 1 and 5000 (Ex: 100).
-    - **losses**: Exact loss count or list of loss counts (Ex: 20 or [5, 10, 25]).
-    - **min_losses**: Minimum number of losses (inclusive), between 1 and 5000 (Ex: 10).
-    - **max_losses**: Maximum number of losses (inclusive), between 1 and 5000 (Ex: 100).
-    - **pushes**: Exact push count or list of push counts (Ex: 20 or [5, 10, 25]).
-    - **min_pushes**: Minimum number of pushes (inclusive), between 1 and 5000 (Ex: 10).
-    - **max_pushes**: Maximum number of pushes (inclusive), between 1 and 5000 (Ex: 100).
-    - **total_games**: Exact total games count or list of total games counts (Ex: 20 or [5, 10, 25]).
-    - **min_total_games**: Minimum number of total games (inclusive), between 1 and 10000 (Ex: 10).
-    - **max_total_games**: Maximum number of total games (inclusive), between 1 and 10000 (Ex: 100).
-    - **win_percentage**: Exact win percentage or list of win percentages (Ex: 75 or [50.3, 62.12, 100]).
-    - **min_win_percentage**: Minimum win percentage (inclusive), between 0 and 100 (Ex: 10).
-    - **max_win_percentage**: Maximum win percentage (inclusive), between 0 and 100 (Ex: 100).
-    - **limit**: Limit the number of results returned (Ex: 100).
-    - **offset**: Offset the results returned (Ex: 0).
-    - **sort_by**: Sort the results by one or more fields. Can be a single field as a string or dictionary (default is ascending), or a list of fields and directions as dictionaries (Ex: 'month', ['wins', 'total_games'], {'field': 'win_percentage', 'order': 'desc'}, [{'field': 'win_percentage', 'order': 'desc'}, {'field': 'total_games', 'order': 'desc'}]).
+    # VALIDATE every min_/max_ pair is ordered; single-field bounds live on the Field definitions
+    @model_validator(mode="after")
+    def validate_ranges(self):
+        for field in ("wins", "losses", "pushes", "total_games", "win_percentage"):
+            low = getattr(self, f"min_{field}")
+            high = getattr(self, f"max_{field}")
+            if low is not None and high is not None and low > high:
+                raise ValueError(f"min_{field} ({low}) must be less than or equal to max_{field} ({high})")
+        return self
+
+
+# Fields that only shape the returned page, not which trends match
+PAGING_FIELDS = frozenset({"limit", "offset", "after", "include_total", "sort_by"})
+
+# Filters that only touch columns the trend_counts summary is grouped by
+SUMMARY_FIELDS = frozenset({"category", "month", "start_month", "end_month", "day_of_week", "spread", "total"})
+
+# Cleared when the trend_counts view turns out not to exist, so later requests count directly
+summary_counts = {"available": True}
+# PostgreSQL SQLSTATE for undefined_table
+UNDEFINED_TABLE = "42P01"
+
+
+def build_trend_filters(filters: TrendFilter) -> list:
     """
+    Build the SQL clauses selecting the trends that match a set of filters.
 
-    query = db.query(Trend)
+    Args:
+        filters: The validated trend filters
+
+    Returns:
+        List of SQLAlchemy clauses to AND together
+    """
+    # Clauses are emitted roughly most- to least-selective (unique id_string, exact counts,
+    # the many spread/season values, then the low-cardinality category/month/day/divisional
+    # columns). This is a best-effort heuristic: the planner may reorder quals by its own
+    # cost estimates, but when it does not, rows tend to be rejected by the most
+    # discriminating check first.
     filters_list = []
 
     # Filter by TREND ID
@@ -748,9 +913,126 @@ def get_trends(filters: TrendFilter, db: Session = Depends(get_connection)):
         if isinstance(filters.trend_id, str):
             filters_list.append(Trend.id_string == filters.trend_id)
         else:
-            print(filters.trend_id)
             filters_list.append(Trend.id_string.in_(filters.trend_id))
 
+    # Filter by WINS
+    if filters.wins not in (None, []):
+        if isinstance(filters.wins, int):
+            filters_list.append(Trend.wins == filters.wins)
+        else:
+            filters_list.append(Trend.wins.in_(filters.wins))
+
+    if filters.min_wins is not None and filters.max_wins is not None:
+        filters_list.append(Trend.wins.between(filters.min_wins, filters.max_wins))
+    elif filters.min_wins is not None:
+        filters_list.append(Trend.wins >= filters.min_wins)
+    elif filters.max_wins is not None:
+        filters_list.append(Trend.wins <= filters.max_wins)
+
+    # Filter by LOSSES
+    if filters.losses not in (None, []):
+        if isinstance(filters.losses, int):
+            filters_list.append(Trend.losses == filters.losses)
+        else:
+            filters_list.append(Trend.losses.in_(filters.losses))
+
+    if filters.min_losses is not None and filters.max_losses is not None:
+        filters_list.append(Trend.losses.between(filters.min_losses, filters.max_losses))
+    elif filters.min_losses is not None:
+        filters_list.append(Trend.losses >= filters.min_losses)
+    elif filters.max_losses is not None:
+        filters_list.append(Trend.losses <= filters.max_losses)
+
+    # Filter by PUSHES
+    if filters.pushes not in (None, []):
+        if isinstance(filters.pushes, int):
+            filters_list.append(Trend.pushes == filters.pushes)
+        else:
+            filters_list.append(Trend.pushes.in_(filters.pushes))
+
+    if filters.min_pushes is not None and filters.max_pushes is not None:
+        filters_list.append(Trend.pushes.between(filters.min_pushes, filters.max_pushes))
+    elif filters.min_pushes is not None:
+        filters_list.append(Trend.pushes >= filters.min_pushes)
+    elif filters.max_pushes is not None:
+        filters_list.append(Trend.pushes <= filters.max_pushes)
+
+    # Filter by TOTAL GAMES
+    if filters.total_games not in (None, []):
+        if isinstance(filters.total_games, int):
+            filters_list.append(Trend.total_games == filters.total_games)
+        else:
+            filters_list.append(Trend.total_games.in_(filters.total_games))
+
+    if filters.min_total_games is not None and filters.max_total_games is not None:
+        filters_list.append(Trend.total_games.between(filters.min_total_games, filters.max_total_games))
+    elif filters.min_total_games is not None:
+        filters_list.append(Trend.total_games >= filters.min_total_games)
+    elif filters.max_total_games is not None:
+        filters_list.append(Trend.total_games <= filters.max_total_games)
+
+    # Filter by WIN PERCENTAGE (0 is a valid percentage, so only None or an empty list skip it)
+    if filters.win_percentage not in (None, []):
+        if isinstance(filters.win_percentage, float):
+            filters_list.append(Trend.win_percentage == filters.win_percentage)
+        else:
+            filters_list.append(Trend.win_percentage.in_(filters.win_percentage))
+
+    if filters.min_win_percentage is not None and filters.max_win_percentage is not None:
+        filters_list.append(Trend.win_percentage.between(filters.min_win_percentage, filters.max_win_percentage))
+    elif filters.min_win_percentage is not None:
+        filters_list.append(Trend.win_percentage >= filters.min_win_percentage)
+    elif filters.max_win_percentage is not None:
+        filters_list.append(Trend.win_percentage <= filters.max_win_percentage)
+
+    # Filter by SPREAD
+    if filters.spread:
+        spread_clauses = []
+
+        # Validation already narrowed the value to 'None' or a SpreadFilter
+        if filters.spread == "None":
+            spread_clauses.append(Trend.spread.is_(None))
+
+        else:
+            # Exact, "or less" and "or more" values all match the stored spread string,
+            # so they are folded into one IN list instead of OR-ing an IN per kind
+            spread_values = []
+            if filters.spread.exact:
+                exact_list = filters.spread.exact
+                spread_values.extend(s for s in exact_list if s != "None")
+                if "None" in exact_list:
+                    spread_clauses.append(Trend.spread.is_(None))
+
+            if filters.spread.or_less is not None:
+                spread_values.extend(SPREAD_OR_LESS[val] for val in filters.spread.or_less)
+
+            if filters.spread.or_more is not None:
+                spread_values.extend(SPREAD_OR_MORE[val] for val in filters.spread.or_more)
+
+            if spread_values:
+                spread_clauses.append(Trend.spread.in_(spread_values))
+
+        if spread_clauses:
+            filters_list.append(or_(*spread_clauses))
+
+    # Filter by SEASONS
+    if filters.seasons:
+        season_clauses = []
+
+        if filters.seasons.exact:
+            season_clauses.append(Trend.seasons.in_(filters.seasons.exact))
+
+        if filters.seasons.since_or_later:
+            index = SEASON_INDEX[filters.seasons.since_or_later]
+            season_clauses.append(Trend.seasons.in_(VALID_SEASONS[index:]))
+
+        if filters.seasons.since_or_earlier:
+            index = SEASON_INDEX[filters.seasons.since_or_earlier]
+            season_clauses.append(Trend.seasons.in_(VALID_SEASONS[: index + 1]))
+
+        if season_clauses:
+            filters_list.append(or_(*season_clauses))
+
     # Filter by CATEGORY
     if filters.category:
         if isinstance(filters.category, str):
@@ -758,24 +1040,37 @@ def get_trends(filters: TrendFilter, db: Session = Depends(get_connection)):
         else:
             filters_list.append(Trend.category.in_(filters.category))
 
-    # Filter by MONTH
-    month_case = case(
-        (Trend.month == "January", 1),
-        (Trend.month == "February", 2),
-        (Trend.month == "March", 3),
-        (Trend.month == "April", 4),
-        (Trend.month == "May", 5),
-        (Trend.month == "June", 6),
-        (Trend.month == "July", 7),
-        (Trend.month == "August", 8),
-        (Trend.month == "September", 9),
-        (Trend.month == "October", 10),
-        (Trend.month == "November", 11),
-        (Trend.month == "December", 12),
-        else_=0
-    )
+    # Filter by TOTAL
+    if filters.total:
+        total_clauses = []
+
+        # Validation already narrowed the value to 'None' or a TotalFilter
+        if filters.total == "None":
+            total_clauses.append(Trend.total.is_(None))
+
+        else:
+            # Exact, "or less" and "or more" values all match the stored total string,
+            # so they are folded into one IN list instead of OR-ing an IN per kind
+            total_values = []
+            if filters.total.exact:
+                exact_list = filters.total.exact
+                total_values.extend(t for t in exact_list if t != "None")
+                if "None" in exact_list:
+                    total_clauses.append(Trend.total.is_(None))
 
-    # Handle month value or list (including "None")
+            if filters.total.or_less is not None:
+                total_values.extend(TOTAL_OR_LESS[val] for val in filters.total.or_less)
+
+            if filters.total.or_more is not None:
+                total_values.extend(TOTAL_OR_MORE[val] for val in filters.total.or_more)
+
+            if total_values:
+                total_clauses.append(Trend.total.in_(total_values))
+
+        if total_clauses:
+            filters_list.append(or_(*total_clauses))
+
+    # Filter by MONTH value or list (including "None")
     month_conditions = []
     if filters.month:
         if isinstance(filters.month, str):
@@ -795,23 +1090,23 @@ def get_trends(filters: TrendFilter, db: Session = Depends(get_connection)):
     if filters.start_month and filters.end_month:
         start = MONTH_MAPPING[filters.start_month]
         end = MONTH_MAPPING[filters.end_month]
-        range_condition = and_(Trend.month != None, month_case.between(start, end))
+        range_condition = Trend.month_num.between(start, end)
     elif filters.start_month:
         start = MONTH_MAPPING[filters.start_month]
-        range_condition = and_(Trend.month != None, month_case >= start)
+        range_condition = Trend.month_num >= start
     elif filters.end_month:
         end = MONTH_MAPPING[filters.end_month]
-        range_condition = and_(Trend.month != None, month_case <= end)
+        range_condition = Trend.month_num <= end
 
     # Combine logic: OR between month filter and range
     if month_conditions and range_condition is not None:
-        print("Combining month conditions with range condition")
+        logger.debug("Combining month conditions with range condition")
         filters_list.append(or_(or_(*month_conditions), range_condition))
     elif month_conditions:
-        print("Adding month conditions")
+        logger.debug("Adding month conditions")
         filters_list.append(or_(*month_conditions))
     elif range_condition is not None:
-        print("Adding range condition")
+        logger.debug("Adding range condition")
         filters_list.append(range_condition)
 
     # Filter by DAY OF WEEK
@@ -855,221 +1150,208 @@ def get_trends(filters: TrendFilter, db: Session = Depends(get_connection)):
             elif filters.divisional in (True, False):
                 filters_list.append(Trend.divisional == filters.divisional)
 
-    # Filter by SPREAD
-    if filters.spread:
-        spread_clauses = []
+    return filters_list
 
-        if isinstance(filters.spread, str):
-            if filters.spread == "None":
-                spread_clauses.append(Trend.spread.is_(None))
 
-        elif isinstance(filters.spread, SpreadFilter):
-            if filters.spread.exact:
-                exact_list = [filters.spread.exact] if isinstance(filters.spread.exact, str) else filters.spread.exact
-                non_null_spreads = [s for s in exact_list if s != "None"]
-                if non_null_spreads:
-                    spread_clauses.append(Trend.spread.in_(non_null_spreads))
-                if "None" in exact_list:
-                    spread_clauses.append(Trend.spread.is_(None))
+def summary_count_query(filters_list: list):
+    """
+    Build a query summing matching trends from the trend_counts summary instead of counting the trends table.
 
-            if filters.spread.or_less is not None:
-                or_less_list = [filters.spread.or_less] if isinstance(filters.spread.or_less, int) else filters.spread.or_less
-                or_less_values = [f"{val} or less" for val in or_less_list]
-                spread_clauses.append(Trend.spread.in_(or_less_values))
+    Args:
+        filters_list: Filter clauses built against Trend columns, limited to SUMMARY_FIELDS
 
-            if filters.spread.or_more is not None:
-                or_more_list = [filters.spread.or_more] if isinstance(filters.spread.or_more, int) else filters.spread.or_more
-                or_more_values = [f"{val} or more" for val in or_more_list]
-                spread_clauses.append(Trend.spread.in_(or_more_values))
+    Returns:
+        SQLAlchemy select of the matching trend count
+    """
+    def to_summary_column(element):
+        if isinstance(element, Column) and element.table is Trend.__table__:
+            return TrendCount.__table__.c[element.key]
+        return None
 
-        if spread_clauses:
-            filters_list.append(or_(*spread_clauses))
+    clauses = [replacement_traverse(clause, {}, to_summary_column) for clause in filters_list]
+    return select(func.coalesce(func.sum(TrendCount.trend_count), 0)).where(*clauses)
 
-    # Filter by TOTAL
-    if filters.total:
-        total_clauses = []
 
-        if isinstance(filters.total, str):
-            if filters.total == "None":
-                total_clauses.append(Trend.total.is_(None))
+@lru_cache(maxsize=256)
+def build_sorted_query(sort_shape: tuple, include_total: bool):
+    """
+    Build the /trends SELECT, ordering and cursor sort columns for one sort_by shape.
 
-        elif isinstance(filters.total, TotalFilter):
-            if filters.total.exact:
-                exact_list = [filters.total.exact] if isinstance(filters.total.exact, str) else filters.total.exact
-                non_null_totals = [t for t in exact_list if t != "None"]
-                if non_null_totals:
-                    total_clauses.append(Trend.total.in_(non_null_totals))
-                if "None" in exact_list:
-                    total_clauses.append(Trend.total.is_(None))
+    Select statements are immutable, so one is built per shape and each request only
+    attaches its own WHERE clauses and paging to it.
 
-            if filters.total.or_less is not None:
-                or_less_list = [filters.total.or_less] if isinstance(filters.total.or_less, int) else filters.total.or_less
-                or_less_values = [f"{val} or less" for val in or_less_list]
-                total_clauses.append(Trend.total.in_(or_less_values))
+    Args:
+        sort_shape: (field, order) pairs from sort_by
+        include_total: Whether to count every matching row in a total_count column
 
-            if filters.total.or_more is not None:
-                or_more_list = [filters.total.or_more] if isinstance(filters.total.or_more, int) else filters.total.or_more
-                or_more_values = [f"{val} or more" for val in or_more_list]
-                total_clauses.append(Trend.total.in_(or_more_values))
+    Returns:
+        Tuple of the ordered select and its (expression, descending) sort keys
+    """
+    # The window count rides along on every row, so the total needs no separate COUNT query;
+    # callers that skip it still get a NULL column so the row layout stays the same
+    total_count = func.count().over() if include_total else null()
+    query = select(*(Trend.__table__.c[key] for key in TREND_COLUMNS), total_count.label("total_count"))
+
+    # Sorting, with the id as a final tiebreaker so keyset cursors are unambiguous
+    sort_keys = []
+    for field, order in sort_shape:
+        if field not in SORT_FIELDS:
+            raise HTTPException(status_code=400, detail=f"Invalid sort field: {field}")
+
+        if field == "month":
+            expr = Trend.month_num
+        elif field == "day_of_week":
+            expr = DAY_SORT_CASE
+        else:
+            expr = getattr(Trend, field)
+        sort_keys.append((expr, order == "desc"))
+    sort_keys.append((Trend.id, False))
 
-        if total_clauses:
-            filters_list.append(or_(*total_clauses))
+    # NULL placement is spelled out (PostgreSQL's defaults) so keyset_condition holds on any backend
+    query = query.order_by(*(
+        expr.desc().nulls_first() if descending else expr.asc().nulls_last()
+        for expr, descending in sort_keys
+    ))
+    # Select the sort values after the count so the last row can seed the next cursor
+    query = query.add_columns(*(expr.label(f"sort_{i}") for i, (expr, _) in enumerate(sort_keys[:-1])))
+    return query, tuple(sort_keys)
 
-    # Filter by SEASONS
-    if filters.seasons:
-        season_clauses = []
-        VALID_SEASONS = [f"since {year}-{year + 1}" for year in range(2006, 2026)]
 
-        if filters.seasons.exact:
-            season_clauses.append(Trend.seasons.in_(filters.seasons.exact))
+async def stream_trends(filters: TrendFilter, total_count: Optional[int], first_batch: list, batches):
+    """
+    Encode a /trends response body incrementally, one batch of rows at a time.
 
-        if filters.seasons.since_or_later:
-            index = VALID_SEASONS.index(filters.seasons.since_or_later)
-            season_clauses.append(Trend.seasons.in_(VALID_SEASONS[index:]))
+    The batches come from the request's dependency session, which FastAPI (0.118+, pinned
+    in requirements.txt) keeps open until the streamed body has been sent.
 
-        if filters.seasons.since_or_earlier:
-            index = VALID_SEASONS.index(filters.seasons.since_or_earlier)
-            season_clauses.append(Trend.seasons.in_(VALID_SEASONS[: index + 1]))
+    count and next_cursor depend on the last row, so they follow the results array.
 
-        if season_clauses:
-            filters_list.append(or_(*season_clauses))
+    Args:
+        filters: The validated trend filters
+        total_count: Number of trends matching the filters, or None when not counted
+        first_batch: The first, already fetched, non-empty batch of rows
+        batches: Async iterator over the remaining row batches
 
-    # Filter by WINS
-    if filters.wins:
-        if isinstance(filters.wins, int):
-            filters_list.append(Trend.wins == filters.wins)
-        else:
-            filters_list.append(Trend.wins.in_(filters.wins))
-
-    if filters.min_wins is not None and filters.max_wins is not None:
-        filters_list.append(Trend.wins.between(filters.min_wins, filters.max_wins))
-    elif filters.min_wins is not None:
-        filters_list.append(Trend.wins >= filters.min_wins)
-    elif filters.max_wins is not None:
-        filters_list.append(Trend.wins <= filters.max_wins)
-
-    # Filter by LOSSES
-    if filters.losses:
-        if isinstance(filters.losses, int):
-            filters_list.append(Trend.losses == filters.losses)
-        else:
-            filters_list.append(Trend.losses.in_(filters.losses))
+    Returns:
+        Async generator of JSON byte chunks
+    """
+    yield (
+        b'{"limit":' + dumps(filters.limit)
+        + b',"offset":' + dumps(filters.offset)
+        + b',"total_count":' + dumps(total_count)
+        + b',"results":['
+    )
 
-    if filters.min_losses is not None and filters.max_losses is not None:
-        filters_list.append(Trend.losses.between(filters.min_losses, filters.max_losses))
-    elif filters.min_losses is not None:
-        filters_list.append(Trend.losses >= filters.min_losses)
-    elif filters.max_losses is not None:
-        filters_list.append(Trend.losses <= filters.max_losses)
+    count = 0
+    batch = first_batch
+    while batch is not None:
+        # zip stops at the table columns, leaving the trailing count and sort values off each trend
+        chunk = b",".join(dumps(dict(zip(TREND_COLUMNS, row))) for row in batch)
+        yield b"," + chunk if count else chunk
+        count += len(batch)
+        last_row = batch[-1]
+        batch = await anext(batches, None)
+
+    next_cursor = (
+        encode_cursor([*last_row[len(TREND_COLUMNS) + 1:], last_row.id])
+        if count == filters.limit else None
+    )
+    yield b'],"count":' + dumps(count) + b',"next_cursor":' + dumps(next_cursor) + b"}"
 
-    # Filter by PUSHES
-    if filters.pushes:
-        if isinstance(filters.pushes, int):
-            filters_list.append(Trend.pushes == filters.pushes)
-        else:
-            filters_list.append(Trend.pushes.in_(filters.pushes))
 
-    if filters.min_pushes is not None and filters.max_pushes is not None:
-        filters_list.append(Trend.pushes.between(filters.min_pushes, filters.max_pushes))
-    elif filters.min_pushes is not None:
-        filters_list.append(Trend.pushes >= filters.min_pushes)
-    elif filters.max_pushes is not None:
-        filters_list.append(Trend.pushes <= filters.max_pushes)
+@router.post("/trends", summary="Retrieve trends with filters", tags=["Trends"])
+async def get_trends(filters: TrendFilter, db: AsyncSession = Depends(get_async_connection)):
+    """
+    Retrieve trends from the database based on the provided filters.
 
-    # Filter by TOTAL GAMES
-    if filters.total_games:
-        if isinstance(filters.total_games, int):
-            filters_list.append(Trend.total_games == filters.total_games)
-        else:
-            filters_list.append(Trend.total_games.in_(filters.total_games))
+    - **trend_id**: Filter by trend ID(s). The format is a comma separated list of filters for trends in the following order: category,month,day of week,divisional,spread,total,seasons since (Ex: 'home ats,October,Thursday,False,8 or less,40 or less,since 2008-2009').
+    - **category**: Filter by category. Can be a single category or a list of categories from the following options: home outright, away outright, favorite outright, underdog outright, home favorite outright, away underdog outright, away favorite outright, home underdog outright, home ats, away ats, favorite ats, underdog ats, home favorite ats, away underdog ats, away favorite ats, home underdog ats, over, under (Ex: 'home ats' or ['home outright', 'away outright']).
+    - **month**: Filter by month. Can be a single month, a list of months, or 'None' (as a string to filter for NULL values) (Ex: 'January' or ['January', 'February'] or 'None').
+    - **start_month**: Start month for filtering trends (Ex: January).
+    - **end_month**: End month for filtering trends (Ex: December).
+    - **day_of_week**: Filter by day of the week. Can be a single day, a list of days, or 'None' (as a string to filter for NULL values) (Ex: 'Monday' or ['Monday', 'Tuesday'] or 'None').
+    - **divisional**: Filter for divisional trends. Can be True, False, or 'None' (as a string to filter for NULL values) (Ex: True or False or 'None').
+    - **spread**: Filter by spread. Can be 'None' to get rows where spread is null, or a structured filter like {'exact': '3.0'} or {'or_more': 6} or {'or_less': 10} or {'or_more': [7, 8, 9]} or {'or_less': [10, 11, 12]} or {'exact': ['7.5', '1.5'], 'or_more': 12} or {'exact': ['7.0', '10.5'], 'or_less': [3, 4], 'or_more': [10, 11]}.
+    - **total**: Filter by total. Can be 'None' for null totals, or a filter like {'exact': '45 or more'} or {'or_less': 50} or {'or_more': [35, 40]} or {'or_less': [45, 50]} or {'exact': ['30 or more', '40 or less'], 'or_more': 55}, etc.
+    - **seasons**: Filter by seasons. Can be exact seasons(s), or a range like {'since_or_later': 'since 2012-2013'}, {'since_or_earlier': 'since 2020-2021'}, etc or a combination of both.
+    - **wins**: Exact win count or list of win counts (Ex: 20 or [5, 10, 25]).
+    - **min_wins**: Minimum number of wins (inclusive), between 1 and 5000 (Ex: 10).
+    - **max_wins**: Maximum number of wins (inclusive), between 1 and 5000 (Ex: 100).
+    - **losses**: Exact loss count or list of loss counts (Ex: 20 or [5, 10, 25]).
+    - **min_losses**: Minimum number of losses (inclusive), between 1 and 5000 (Ex: 10).
+    - **max_losses**: Maximum number of losses (inclusive), between 1 and 5000 (Ex: 100).
+    - **pushes**: Exact push count or list of push counts (Ex: 20 or [5, 10, 25]).
+    - **min_pushes**: Minimum number of pushes (inclusive), between 1 and 5000 (Ex: 10).
+    - **max_pushes**: Maximum number of pushes (inclusive), between 1 and 5000 (Ex: 100).
+    - **total_games**: Exact total games count or list of total games counts (Ex: 20 or [5, 10, 25]).
+    - **min_total_games**: Minimum number of total games (inclusive), between 1 and 10000 (Ex: 10).
+    - **max_total_games**: Maximum number of total games (inclusive), between 1 and 10000 (Ex: 100).
+    - **win_percentage**: Exact win percentage or list of win percentages (Ex: 75 or [50.3, 62.12, 100]).
+    - **min_win_percentage**: Minimum win percentage (inclusive), between 0 and 100 (Ex: 10).
+    - **max_win_percentage**: Maximum win percentage (inclusive), between 0 and 100 (Ex: 100).
+    - **limit**: Limit the number of results returned (Ex: 100).
+    - **offset**: Offset the results returned (Ex: 0).
+    - **after**: Keyset cursor from a previous response's next_cursor; continues after that row and ignores offset.
+    - **include_total**: Whether to compute total_count (default True); false skips counting every match and returns null.
+    - **sort_by**: Sort the results by one or more fields. Can be a single field as a string or dictionary (default is ascending), or a list of fields and directions as dictionaries (Ex: 'month', ['wins', 'total_games'], {'field': 'win_percentage', 'order': 'desc'}, [{'field': 'win_percentage', 'order': 'desc'}, {'field': 'total_games', 'order': 'desc'}]).
+    """
 
-    if filters.min_total_games is not None and filters.max_total_games is not None:
-        filters_list.append(Trend.total_games.between(filters.min_total_games, filters.max_total_games))
-    elif filters.min_total_games is not None:
-        filters_list.append(Trend.total_games >= filters.min_total_games)
-    elif filters.max_total_games is not None:
-        filters_list.append(Trend.total_games <= filters.max_total_games)
+    # Requests that only page/sort the full table skip the filter builder entirely
+    if filters.model_fields_set <= PAGING_FIELDS:
+        filters_list = []
+    else:
+        filters_list = build_trend_filters(filters)
+
+    # Filters on the summary's grouped columns are counted from the trend_counts view,
+    # which lets the main query skip the count(*) OVER () window over every match
+    total_count = None
+    if (
+        summary_counts["available"] and filters.include_total
+        and filters.model_fields_set - PAGING_FIELDS <= SUMMARY_FIELDS
+    ):
+        try:
+            total_count = await db.scalar(summary_count_query(filters_list))
+        except Exception as e:
+            await db.rollback()
+            # Only a missing view turns the summary off for good; other failures (a dropped
+            # connection, a statement timeout) skip it for this request alone
+            if isinstance(e, ProgrammingError) and getattr(e.orig, "pgcode", None) == UNDEFINED_TABLE:
+                logger.warning("trend_counts view not found (%s), counting matches in the trends query from now on", e)
+                summary_counts["available"] = False
+            else:
+                logger.warning("trend_counts summary query failed (%s), counting matches in the trends query", e)
 
-    # Filter by WIN PERCENTAGE
-    if filters.win_percentage:
-        if isinstance(filters.win_percentage, float):
-            filters_list.append(Trend.win_percentage == filters.win_percentage)
-        else:
-            filters_list.append(Trend.win_percentage.in_(filters.win_percentage))
+    # The window count only sees rows past a cursor, so cursor pages count every match
+    # separately and total_count stays the same on every page
+    if filters.include_total and filters.after and total_count is None:
+        total_count = await db.scalar(select(func.count()).select_from(Trend).where(*filters_list))
 
-    if filters.min_win_percentage is not None and filters.max_win_percentage is not None:
-        filters_list.append(Trend.win_percentage.between(filters.min_win_percentage, filters.max_win_percentage))
-    elif filters.min_win_percentage is not None:
-        filters_list.append(Trend.win_percentage >= filters.min_win_percentage)
-    elif filters.max_win_percentage is not None:
-        filters_list.append(Trend.win_percentage <= filters.max_win_percentage)
+    # The ordered SELECT only depends on sort_by and include_total, so it is reused across requests
+    sort_shape = tuple((sort.field, sort.order) for sort in filters.sort_by or ())
+    query, sort_keys = build_sorted_query(sort_shape, filters.include_total and total_count is None)
 
     # Apply filters to the query
     if filters_list:
-        query = query.filter(*filters_list)
-
-    total_count = query.order_by(None).count()
-
-    # Sorting
-    valid_sort_fields = {c_attr.key for c_attr in inspect(Trend).mapper.column_attrs}
-    if filters.sort_by:
-        sort_columns = []
-        for sort in filters.sort_by:
-            if sort.field not in valid_sort_fields:
-                raise HTTPException(status_code=400, detail=f"Invalid sort field: {sort.field}")
-
-            if sort.field == "month":
-                month_case = case(
-                    (Trend.month == "January", 1),
-                    (Trend.month == "February", 2),
-                    (Trend.month == "March", 3),
-                    (Trend.month == "April", 4),
-                    (Trend.month == "May", 5),
-                    (Trend.month == "June", 6),
-                    (Trend.month == "July", 7),
-                    (Trend.month == "August", 8),
-                    (Trend.month == "September", 9),
-                    (Trend.month == "October", 10),
-                    (Trend.month == "November", 11),
-                    (Trend.month == "December", 12),
-                    (Trend.month == None, 13),
-                    else_=14
-                )
-                sort_columns.append(month_case.desc() if sort.order == "desc" else month_case.asc())
-            elif sort.field == 'day_of_week':
-                day_case = case(
-                    (Trend.day_of_week == "Sunday", 1),
-                    (Trend.day_of_week == "Monday", 2),
-                    (Trend.day_of_week == "Tuesday", 3),
-                    (Trend.day_of_week == "Wednesday", 4),
-                    (Trend.day_of_week == "Thursday", 5),
-                    (Trend.day_of_week == "Friday", 6),
-                    (Trend.day_of_week == "Saturday", 7),
-                    (Trend.day_of_week == None, 8),
-                    else_=9
-                )
-                sort_columns.append(day_case.desc() if sort.order == "desc" else day_case.asc())
-            else:
-                col = getattr(Trend, sort.field)
-                sort_columns.append(col.desc() if sort.order == "desc" else col.asc())
-
-        if sort_columns:
-            query = query.order_by(*sort_columns)
-
-    # Pagination
+        query = query.where(*filters_list)
+
+    # Pagination: a cursor continues after its row, otherwise fall back to offset
+    if filters.after:
+        cursor = decode_cursor(filters.after)
+        if len(cursor) != len(sort_keys):
+            raise HTTPException(status_code=400, detail="Cursor does not match the requested sort_by")
+        query = query.where(keyset_condition(sort_keys, cursor))
+    elif filters.offset:
+        query = query.offset(filters.offset)
     if filters.limit:
         query = query.limit(filters.limit)
-    if filters.offset:
-        query = query.offset(filters.offset)
 
-    trends = query.all()
-
-    if not trends:
-        return []
-    return {
-        "limit": filters.limit,
-        "offset": filters.offset,
-        "count": len(trends),
-        "total_count": total_count,
-        "results": trends,
-    }
\ No newline at end of file
+    # Stream rows off a server-side cursor so large pages never sit in memory all at once
+    result = await db.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+    batches = result.partitions()
+    first_batch = await anext(batches, None)
+
+    if first_batch is None:
+        return json_response(dumps([]))
+    if total_count is None:
+        total_count = first_batch[0].total_count
+    return StreamingResponse(stream_trends(filters, total_count, first_batch, batches), media_type="application/json")
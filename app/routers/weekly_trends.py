@@ -1,13 +1,17 @@
+import logging
+import orjson
 from sqlalchemy.sql import func
-from itertools import permutations
+from itertools import chain, permutations
 from sqlalchemy.orm import Session
-from sqlalchemy import case, and_, or_
+from sqlalchemy import case, cast, and_, or_, select, Float, Text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.inspection import inspect
 from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Union, Literal
 from fastapi import APIRouter, HTTPException, Depends
 from app.models.weekly_trend import WeeklyTrend
 from app.database.connection import get_connection
+from app.responses import dumps, json_response
 from app.enums.trend_enums import CategoryEnum, MonthEnum, DayOfWeekEnum
 from app.cache import (
     generate_cache_key,
@@ -17,6 +21,8 @@ from app.cache import (
     set_weekly_filter_options_cache
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 MONTH_MAPPING = {
@@ -34,6 +40,19 @@ MONTH_MAPPING = {
     "December": 12,
 }
 
+# Seasons in chronological order; the handler slices this for since_or_* ranges
+VALID_SEASONS = tuple(f"since {year}-{year + 1}" for year in range(2006, 2026))
+VALID_SEASONS_SET = frozenset(VALID_SEASONS)
+SEASON_INDEX = {season: index for index, season in enumerate(VALID_SEASONS)}
+
+# Mapped columns that results can be sorted by, resolved once instead of inspecting the mapper per request
+SORT_FIELDS = frozenset(c_attr.key for c_attr in inspect(WeeklyTrend).mapper.column_attrs)
+
+# Columns of each result row, in table order, for the JSON the database builds
+RESPONSE_COLUMNS = tuple(WeeklyTrend.__table__.columns.keys())
+# NUMERIC columns are cast to floats so they render as JSON numbers like 0.75 rather than 0.750
+FLOAT_COLUMNS = frozenset({"win_percentage"})
+
 ##################################
 ######## FILTER OBJECTS ##########
 ##################################
@@ -175,6 +194,13 @@ class WeeklyTrendFilter(BaseModel):
             "Example: 0."
         )
     )
+    include_total: bool = Field(
+        True,
+        description=(
+            "Whether to count every matching row for 'total_count'. "
+            "Set to false to skip the count; 'total_count' is then null."
+        )
+    )
 
     # VALIDATE LIMIT is between 1 and 5000000
     @validator("limit", pre=True)
@@ -214,7 +240,7 @@ class WeeklyTrendFilter(BaseModel):
                 raise ValueError(
                     "If trend_id is a string, it must have exactly 7 comma-separated values."
                 )
-            print("TREND ID is a single string.")
+            logger.debug("TREND ID is a single string.")
             return value
 
         elif isinstance(value, list):
@@ -226,7 +252,7 @@ class WeeklyTrendFilter(BaseModel):
                     raise ValueError(
                         f"Each trend_id in the list must have exactly 7 comma-separated values. Got: {values}"
                     )
-            print("TREND ID is a list of strings.")
+            logger.debug("TREND ID is a list of strings.")
             return value
 
         raise ValueError("trend_id must be either a string or a list of strings.")
@@ -537,21 +563,19 @@ class WeeklyTrendFilter(BaseModel):
     @validator("seasons")
     def validate_season(cls, seasons):
         if seasons:
-            VALID_SEASONS = [f"since {year}-{year + 1}" for year in range(2006, 2026)]
-
             # Validate exact
             if seasons.exact:
                 exact_list = [seasons.exact] if isinstance(seasons.exact, str) else seasons.exact
                 for s in exact_list:
-                    if s not in VALID_SEASONS:
-                        raise ValueError(f"Invalid seasons in 'exact': '{s}'. Must be one of {VALID_SEASONS}.")
+                    if s not in VALID_SEASONS_SET:
+                        raise ValueError(f"Invalid seasons in 'exact': '{s}'. Must be one of {list(VALID_SEASONS)}.")
                 seasons.exact = exact_list
 
             # Validate since_or_later / since_or_earlier
-            if seasons.since_or_later and seasons.since_or_later not in VALID_SEASONS:
-                raise ValueError(f"'since_or_later' value '{seasons.since_or_later}' is not valid. Must be one of {VALID_SEASONS}.")
-            if seasons.since_or_earlier and seasons.since_or_earlier not in VALID_SEASONS:
-                raise ValueError(f"'since_or_earlier' value '{seasons.since_or_earlier}' is not valid. Must be one of {VALID_SEASONS}.")
+            if seasons.since_or_later and seasons.since_or_later not in VALID_SEASONS_SET:
+                raise ValueError(f"'since_or_later' value '{seasons.since_or_later}' is not valid. Must be one of {list(VALID_SEASONS)}.")
+            if seasons.since_or_earlier and seasons.since_or_earlier not in VALID_SEASONS_SET:
+                raise ValueError(f"'since_or_earlier' value '{seasons.since_or_earlier}' is not valid. Must be one of {list(VALID_SEASONS)}.")
 
         return seasons
 
@@ -855,18 +879,19 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
     - **max_win_percentage**: Maximum win percentage (inclusive), between 0 and 100 (Ex: 100).
     - **limit**: Limit the number of results returned (Ex: 100).
     - **offset**: Offset the results returned (Ex: 0).
+    - **include_total**: Whether to compute total_count (default True); false skips the COUNT query and returns null.
     - **games_applicable**: Filter by games applicable to the trend. Supports nested structure with games and match_mode for advanced filtering, or flat values for backwards compatibility. Game format: 'HOMEABBREVvsAWAYABBREV' (e.g., 'PHIvsDAL', 'CLEvsCIN'). Examples: {'games': 'PHIvsDAL', 'match_mode': 'contains_all'}, {'games': ['PHIvsDAL', 'CLEvsCIN'], 'match_mode': 'contains_any'}, or just 'PHIvsDAL'. Match modes: 'contains_all' (default), 'contains_any', 'exact', 'excludes_any'.
     - **sort_by**: Sort the results by one or more fields. Can be a single field as a string or dictionary (default is ascending), or a list of fields and directions as dictionaries (Ex: 'month', ['wins', 'total_games'], {'field': 'win_percentage', 'order': 'desc'}, [{'field': 'win_percentage', 'order': 'desc'}, {'field': 'total_games', 'order': 'desc'}]).
     """
 
     # Generate cache key from filters
-    cache_key = generate_cache_key(filters.dict())
+    cache_key = generate_cache_key(filters.model_dump())
     
     # Try to get from cache first
     cached_data = get_weekly_trends_from_cache(cache_key)
     if cached_data is not None:
-        print(f"🎯 CACHE HIT - Weekly trends cache hit for key: {cache_key[:16]}...")
-        return cached_data
+        logger.debug("Weekly trends cache hit for key: %s...", cache_key[:16])
+        return json_response(cached_data, headers={"x-cache": "hit"})
 
     query = db.query(WeeklyTrend)
     filters_list = []
@@ -876,7 +901,7 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
         if isinstance(filters.trend_id, str):
             filters_list.append(WeeklyTrend.id_string == filters.trend_id)
         else:
-            print(filters.trend_id)
+            logger.debug("Filtering by trend ids: %s", filters.trend_id)
             filters_list.append(WeeklyTrend.id_string.in_(filters.trend_id))
 
     # Filter by CATEGORY
@@ -933,13 +958,13 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
 
     # Combine logic: OR between month filter and range
     if month_conditions and range_condition is not None:
-        print("Combining month conditions with range condition")
+        logger.debug("Combining month conditions with range condition")
         filters_list.append(or_(or_(*month_conditions), range_condition))
     elif month_conditions:
-        print("Adding month conditions")
+        logger.debug("Adding month conditions")
         filters_list.append(or_(*month_conditions))
     elif range_condition is not None:
-        print("Adding range condition")
+        logger.debug("Adding range condition")
         filters_list.append(range_condition)
 
     # Filter by DAY OF WEEK
@@ -1046,24 +1071,23 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
     # Filter by SEASONS
     if filters.seasons:
         season_clauses = []
-        VALID_SEASONS = [f"since {year}-{year + 1}" for year in range(2006, 2026)]
 
         if filters.seasons.exact:
             season_clauses.append(WeeklyTrend.seasons.in_(filters.seasons.exact))
 
         if filters.seasons.since_or_later:
-            index = VALID_SEASONS.index(filters.seasons.since_or_later)
+            index = SEASON_INDEX[filters.seasons.since_or_later]
             season_clauses.append(WeeklyTrend.seasons.in_(VALID_SEASONS[index:]))
 
         if filters.seasons.since_or_earlier:
-            index = VALID_SEASONS.index(filters.seasons.since_or_earlier)
+            index = SEASON_INDEX[filters.seasons.since_or_earlier]
             season_clauses.append(WeeklyTrend.seasons.in_(VALID_SEASONS[: index + 1]))
 
         if season_clauses:
             filters_list.append(or_(*season_clauses))
 
     # Filter by WINS
-    if filters.wins:
+    if filters.wins not in (None, []):
         if isinstance(filters.wins, int):
             filters_list.append(WeeklyTrend.wins == filters.wins)
         else:
@@ -1077,7 +1101,7 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
         filters_list.append(WeeklyTrend.wins <= filters.max_wins)
 
     # Filter by LOSSES
-    if filters.losses:
+    if filters.losses not in (None, []):
         if isinstance(filters.losses, int):
             filters_list.append(WeeklyTrend.losses == filters.losses)
         else:
@@ -1091,7 +1115,7 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
         filters_list.append(WeeklyTrend.losses <= filters.max_losses)
 
     # Filter by PUSHES
-    if filters.pushes:
+    if filters.pushes not in (None, []):
         if isinstance(filters.pushes, int):
             filters_list.append(WeeklyTrend.pushes == filters.pushes)
         else:
@@ -1105,7 +1129,7 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
         filters_list.append(WeeklyTrend.pushes <= filters.max_pushes)
 
     # Filter by TOTAL GAMES
-    if filters.total_games:
+    if filters.total_games not in (None, []):
         if isinstance(filters.total_games, int):
             filters_list.append(WeeklyTrend.total_games == filters.total_games)
         else:
@@ -1118,8 +1142,8 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
     elif filters.max_total_games is not None:
         filters_list.append(WeeklyTrend.total_games <= filters.max_total_games)
 
-    # Filter by WIN PERCENTAGE
-    if filters.win_percentage:
+    # Filter by WIN PERCENTAGE (0 is a valid percentage, so only None or an empty list skip it)
+    if filters.win_percentage not in (None, []):
         if isinstance(filters.win_percentage, float):
             filters_list.append(WeeklyTrend.win_percentage == filters.win_percentage)
         else:
@@ -1182,14 +1206,14 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
     if filters_list:
         query = query.filter(*filters_list)
 
-    total_count = query.order_by(None).count()
+    # The COUNT re-runs the whole filtered query, so it is skipped when the caller opts out
+    total_count = query.order_by(None).count() if filters.include_total else None
 
-    # Sorting
-    valid_sort_fields = {c_attr.key for c_attr in inspect(WeeklyTrend).mapper.column_attrs}
+    # Sorting; the (expression, order) pairs are kept so the JSON aggregate below can reuse them
+    sort_keys = []
     if filters.sort_by:
-        sort_columns = []
         for sort in filters.sort_by:
-            if sort.field not in valid_sort_fields:
+            if sort.field not in SORT_FIELDS:
                 raise HTTPException(status_code=400, detail=f"Invalid sort field: {sort.field}")
 
             if sort.field == "month":
@@ -1209,7 +1233,7 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
                     (WeeklyTrend.month == None, 13),
                     else_=14
                 )
-                sort_columns.append(month_case.desc() if sort.order == "desc" else month_case.asc())
+                sort_keys.append((month_case, sort.order))
             elif sort.field == 'day_of_week':
                 day_case = case(
                     (WeeklyTrend.day_of_week == "Sunday", 1),
@@ -1222,13 +1246,12 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
                     (WeeklyTrend.day_of_week == None, 8),
                     else_=9
                 )
-                sort_columns.append(day_case.desc() if sort.order == "desc" else day_case.asc())
+                sort_keys.append((day_case, sort.order))
             else:
-                col = getattr(WeeklyTrend, sort.field)
-                sort_columns.append(col.desc() if sort.order == "desc" else col.asc())
+                sort_keys.append((getattr(WeeklyTrend, sort.field), sort.order))
 
-        if sort_columns:
-            query = query.order_by(*sort_columns)
+        if sort_keys:
+            query = query.order_by(*(expr.desc() if order == "desc" else expr.asc() for expr, order in sort_keys))
 
     # Pagination
     if filters.limit:
@@ -1236,23 +1259,39 @@ def get_trends(filters: WeeklyTrendFilter, db: Session = Depends(get_connection)
     if filters.offset:
         query = query.offset(filters.offset)
 
-    trends = query.all()
-
-    if not trends:
+    # PostgreSQL aggregates the page into a single JSON array (cast to text so the driver
+    # hands it back undecoded), so no rows are hydrated into ORM objects. An outer aggregate
+    # does not keep a subquery's ORDER BY, so the page carries its sort keys as sort_i
+    # columns and json_agg orders by them itself
+    page = query.add_columns(*(expr.label(f"sort_{i}") for i, (expr, _) in enumerate(sort_keys))).subquery("t")
+    row_json = func.json_build_object(*chain.from_iterable(
+        (key, cast(page.c[key], Float) if key in FLOAT_COLUMNS else page.c[key]) for key in RESPONSE_COLUMNS
+    ))
+    if sort_keys:
+        row_json = aggregate_order_by(row_json, *(
+            page.c[f"sort_{i}"].desc() if order == "desc" else page.c[f"sort_{i}"].asc()
+            for i, (_, order) in enumerate(sort_keys)
+        ))
+    count, results_json = db.execute(
+        select(func.count(), cast(func.json_agg(row_json), Text)).select_from(page)
+    ).one()
+
+    if not count:
         return []
-    
-    result = {
-        "limit": filters.limit,
-        "offset": filters.offset,
-        "count": len(trends),
-        "total_count": total_count,
-        "results": trends,
-    }
-    
-    # Cache the result
+
+    # Splice the pre-rendered array into the response envelope instead of re-encoding it
+    result = (
+        b'{"limit":' + dumps(filters.limit)
+        + b',"offset":' + dumps(filters.offset)
+        + b',"count":' + dumps(count)
+        + b',"total_count":' + dumps(total_count)
+        + b',"results":' + results_json.encode() + b"}"
+    )
+
+    # Cache the serialized response
     set_weekly_trends_cache(cache_key, result)
-    
-    return result
+
+    return json_response(result)
 
 
 @router.get("/weekly-filter-options", summary="Get available filter options for weekly trends", tags=["WeeklyTrends"])
@@ -1265,21 +1304,19 @@ def get_weekly_filter_options(db: Session = Depends(get_connection)):
     # Check cache first
     cached_result = get_weekly_filter_options_from_cache()
     if cached_result is not None:
-        return cached_result
+        return json_response(cached_result, headers={"x-cache": "hit"})
     
     try:
         # Try to get filter options from the pre-computed filter_values table first
         try:
             from app.models.filter_value import FilterValue
-            import json
             
-            filter_data = db.query(FilterValue).all()
+            # Plain Core rows: a read-only lookup needs no ORM instances or identity map
+            filter_data = db.execute(select(FilterValue.filter_type, FilterValue.values_json)).all()
             
             if filter_data:
                 # Convert to dictionary for easy lookup
-                filter_dict = {}
-                for row in filter_data:
-                    filter_dict[row.filter_type] = json.loads(row.values_json)
+                filter_dict = {filter_type: orjson.loads(values_json) for filter_type, values_json in filter_data}
                 
                 result = {
                     "categories": filter_dict.get("category", []),
@@ -1290,15 +1327,16 @@ def get_weekly_filter_options(db: Session = Depends(get_connection)):
                     "totals": filter_dict.get("total", [])
                 }
                 
-                # Cache the result using the integrated cache system
-                set_weekly_filter_options_cache(result)
+                # Cache the serialized result using the integrated cache system
+                body = dumps(result)
+                set_weekly_filter_options_cache(body)
                 
-                return result
+                return json_response(body)
             else:
                 raise Exception("filter_values table is empty")
                 
         except Exception as e:
-            print(f"⚠️  Filter_values table not available ({e}), falling back to DISTINCT queries")
+            logger.warning("Filter_values table not available (%s), falling back to DISTINCT queries", e)
             # Rollback the failed transaction to prevent "InFailedSqlTransaction" errors
             db.rollback()
             
@@ -1373,10 +1411,11 @@ def get_weekly_filter_options(db: Session = Depends(get_connection)):
             "totals": totals_sorted
         }
         
-        # Cache the result using the integrated cache system
-        set_weekly_filter_options_cache(result)
+        # Cache the serialized result using the integrated cache system
+        body = dumps(result)
+        set_weekly_filter_options_cache(body)
         
-        return result
+        return json_response(body)
         
     except Exception as e:
         # Return empty lists if there's any error but don't cache the error result
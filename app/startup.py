@@ -5,19 +5,176 @@ This module handles initialization tasks that need to run when the application s
 including pre-populating caches with initial data.
 """
 
+import asyncio
+import logging
+import orjson
+from sqlalchemy import cast, func, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Session
+from fastapi import Response
 from app.database.connection import get_connection
-from app.routers.weekly_trends import WeeklyTrendFilter, get_trends, get_weekly_filter_options
-from app.routers.upcoming_games import get_upcoming_games
+from app.routers.weekly_trends import WeeklyTrendFilter, GamesApplicableFilter, SortField, get_trends, get_weekly_filter_options
+from app.routers.upcoming_games import fetch_upcoming_games
+from app.responses import dumps
 from app.cache import (
     generate_cache_key,
-    set_weekly_trends_cache,
-    set_upcoming_games_cache,
+    get_weekly_trends_from_cache,
     set_weekly_filter_options_cache,
-    get_weekly_filter_options_from_cache,
     extract_games_from_upcoming_games
 )
 
+logger = logging.getLogger(__name__)
+
+# Filters for the initial weekly trends query; only games_applicable depends on the
+# current week, so the rest is built once at import and merged in at startup
+INITIAL_FILTER_DATA = {
+    "category": [
+        "home ats",
+        "home outright",
+        "away ats",
+        "away outright",
+        "favorite ats",
+        "favorite outright",
+        "underdog ats",
+        "underdog outright",
+        "home favorite ats",
+        "home favorite outright",
+        "away underdog ats",
+        "away underdog outright",
+        "away favorite ats",
+        "away favorite outright",
+        "home underdog ats",
+        "home underdog outright",
+        "over",
+        "under"
+    ],
+    "month": ["September", "None"],
+    "day_of_week": ["Sunday", "Monday", "Thursday", "Friday", "None"],
+    "spread": {
+        "exact": [
+            "None",
+            "1.5",
+            "2.5",
+            "3.0",
+            "3.5",
+            "5.5",
+            "6.5",
+            "7.5",
+            "8.5"
+        ],
+        "or_less": [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14],
+        "or_more": [1, 2, 3, 4, 5, 6, 7, 8]
+    },
+    "total": {
+        "exact": "None",
+        "or_less": [40, 45, 50, 55, 60],
+        "or_more": [30, 35, 40, 45, 50]
+    },
+    "seasons": {
+        "exact": [
+            "since 2006-2007",
+            "since 2007-2008",
+            "since 2008-2009",
+            "since 2009-2010",
+            "since 2010-2011",
+            "since 2011-2012",
+            "since 2012-2013",
+            "since 2013-2014",
+            "since 2014-2015",
+            "since 2015-2016",
+            "since 2016-2017",
+            "since 2017-2018",
+            "since 2018-2019",
+            "since 2019-2020",
+            "since 2020-2021",
+            "since 2021-2022",
+            "since 2022-2023",
+            "since 2023-2024",
+            "since 2024-2025"
+        ]
+    },
+    "limit": 5000,
+    "offset": 0,
+    "sort_by": [
+        {"field": "win_percentage", "order": "desc"},
+        {"field": "total_games", "order": "desc"}
+    ]
+}
+
+# The static filters are validated once here; startup only validates the current games
+INITIAL_FILTER = WeeklyTrendFilter(**INITIAL_FILTER_DATA)
+
+# Other sort orders offered on the weekly trends page, warmed alongside the default one
+WARM_SORT_VARIANTS = (
+    [SortField(field="total_games", order="desc"), SortField(field="win_percentage", order="desc")],
+    [SortField(field="wins", order="desc"), SortField(field="win_percentage", order="desc")],
+)
+
+
+def load_weekly_filter_options(db_session: Session) -> dict:
+    """
+    Cache weekly filter options, preferring the pre-computed filter_values table.
+
+    Args:
+        db_session: The database session to query with
+
+    Returns:
+        Dictionary of the filter options that were loaded
+    """
+    try:
+        # Try to get filter options from the pre-computed filter_values table.
+        # PostgreSQL folds every row into one JSON object keyed by filter type,
+        # which the driver decodes in a single pass (NULL when the table is empty)
+        from app.models.filter_value import FilterValue
+        
+        filter_dict = db_session.execute(
+            select(func.json_object_agg(FilterValue.filter_type, cast(FilterValue.values_json, JSONB)))
+        ).scalar()
+        
+        if filter_dict:
+            filter_options_from_table = {
+                "categories": filter_dict.get("category", []),
+                "months": filter_dict.get("month", []),
+                "day_of_weeks": filter_dict.get("day_of_week", []),
+                "divisionals": filter_dict.get("divisional", []),
+                "spreads": filter_dict.get("spread", []),
+                "totals": filter_dict.get("total", [])
+            }
+            
+            set_weekly_filter_options_cache(dumps(filter_options_from_table))
+            logger.info("Using filter_values table for startup cache")
+            return filter_options_from_table
+        else:
+            raise Exception("filter_values table is empty")
+            
+    except Exception as e:
+        logger.warning("Filter_values table not available (%s), falling back to live query", e)
+        # Rollback the failed transaction to prevent "InFailedSqlTransaction" errors
+        db_session.rollback()
+        # Fallback to querying the database directly (but only once during startup);
+        # the endpoint caches its own serialized result, or returns empty lists uncached on error
+        response = get_weekly_filter_options(db_session)
+        return orjson.loads(response.body) if isinstance(response, Response) else response
+
+
+def warm_weekly_trends(weekly_filter: WeeklyTrendFilter) -> tuple:
+    """
+    Run a weekly trends query on its own session, which caches its serialized response.
+
+    Args:
+        weekly_filter: The validated weekly trends filter to warm
+
+    Returns:
+        Tuple of the cache key and the cached response bytes (None if nothing matched)
+    """
+    db_session = next(get_connection())
+    try:
+        cache_key = generate_cache_key(weekly_filter.model_dump())
+        get_trends(weekly_filter, db_session)
+        return cache_key, get_weekly_trends_from_cache(cache_key)
+    finally:
+        db_session.close()
+
 
 async def startup_cache_initialization():
     """
@@ -25,158 +182,56 @@ async def startup_cache_initialization():
     
     This function:
     1. Fetches upcoming games and caches the result
-    2. Fetches weekly filter options from the pre-computed filter_values table (with fallback to DISTINCT queries)
+    2. Concurrently fetches weekly filter options from the pre-computed filter_values table (with fallback to DISTINCT queries)
     3. Creates the initial weekly trends query with dynamic games_applicable
-    4. Caches the initial weekly trends query result
+    4. Caches the initial weekly trends query result, and the same query under the other common sort orders
     """
     try:
-        # Get database session
+        # Get database sessions; the two independent reads below each get their own
         db_session = next(get_connection())
+        filter_session = next(get_connection())
         
-        # Cache upcoming games first
-        upcoming_games_result = await get_upcoming_games(db_session)
-        set_upcoming_games_cache(upcoming_games_result)
-        
-        # Cache weekly filter options - query filter_values table for optimal performance
-        try:
-            # Try to get filter options from the pre-computed filter_values table
-            from app.models.filter_value import FilterValue
-            import json
-            
-            filter_data = db_session.query(FilterValue).all()
-            
-            if filter_data:
-                # Convert to dictionary for easy lookup
-                filter_dict = {}
-                for row in filter_data:
-                    filter_dict[row.filter_type] = json.loads(row.values_json)
-                
-                filter_options_from_table = {
-                    "categories": filter_dict.get("category", []),
-                    "months": filter_dict.get("month", []),
-                    "day_of_weeks": filter_dict.get("day_of_week", []),
-                    "divisionals": filter_dict.get("divisional", []),
-                    "spreads": filter_dict.get("spread", []),
-                    "totals": filter_dict.get("total", [])
-                }
-                
-                set_weekly_filter_options_cache(filter_options_from_table)
-                print("✅ Using filter_values table for startup cache")
-            else:
-                raise Exception("filter_values table is empty")
-                
-        except Exception as e:
-            print(f"⚠️  Filter_values table not available ({e}), falling back to live query")
-            # Rollback the failed transaction to prevent "InFailedSqlTransaction" errors
-            db_session.rollback()
-            # Fallback to querying the database directly (but only once during startup)
-            weekly_filter_options_result = get_weekly_filter_options(db_session)
-            set_weekly_filter_options_cache(weekly_filter_options_result)
+        # Cache upcoming games and weekly filter options concurrently on worker threads,
+        # since the sync sessions would otherwise run the queries back to back
+        upcoming_games_result, filter_options = await asyncio.gather(
+            asyncio.to_thread(fetch_upcoming_games, db_session),
+            asyncio.to_thread(load_weekly_filter_options, filter_session)
+        )
         
         # Extract game strings for weekly trends query
         current_games = extract_games_from_upcoming_games(upcoming_games_result)
         
-        # Create the initial weekly trends filter with dynamic games
-        # Note: We'll create the filter data as a dictionary that matches the WeeklyTrendFilter structure
-        initial_filter_data = {
-            "category": [
-                "home ats",
-                "home outright", 
-                "away ats",
-                "away outright",
-                "favorite ats",
-                "favorite outright",
-                "underdog ats",
-                "underdog outright",
-                "home favorite ats",
-                "home favorite outright",
-                "away underdog ats",
-                "away underdog outright",
-                "away favorite ats",
-                "away favorite outright",
-                "home underdog ats",
-                "home underdog outright",
-                "over",
-                "under"
-            ],
-            "month": ["September", "None"],
-            "day_of_week": ["Sunday", "Monday", "Thursday", "Friday", "None"],
-            "spread": {
-                "exact": [
-                    "None",
-                    "1.5",
-                    "2.5", 
-                    "3.0",
-                    "3.5",
-                    "5.5",
-                    "6.5",
-                    "7.5",
-                    "8.5"
-                ],
-                "or_less": [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14],
-                "or_more": [1, 2, 3, 4, 5, 6, 7, 8]
-            },
-            "total": {
-                "exact": "None",
-                "or_less": [40, 45, 50, 55, 60],
-                "or_more": [30, 35, 40, 45, 50]
-            },
-            "seasons": {
-                "exact": [
-                    "since 2006-2007",
-                    "since 2007-2008",
-                    "since 2008-2009",
-                    "since 2009-2010",
-                    "since 2010-2011",
-                    "since 2011-2012",
-                    "since 2012-2013",
-                    "since 2013-2014",
-                    "since 2014-2015",
-                    "since 2015-2016",
-                    "since 2016-2017",
-                    "since 2017-2018",
-                    "since 2018-2019",
-                    "since 2019-2020",
-                    "since 2020-2021",
-                    "since 2021-2022",
-                    "since 2022-2023",
-                    "since 2023-2024",
-                    "since 2024-2025"
-                ]
-            },
-            "limit": 5000,
-            "offset": 0,
-            "sort_by": [
-                {"field": "win_percentage", "order": "desc"},
-                {"field": "total_games", "order": "desc"}
-            ],
-            "games_applicable": {
-                "games": current_games,
-                "match_mode": "contains_any"
-            }
-        }
-        
-        # Create the filter object
-        initial_filter = WeeklyTrendFilter(**initial_filter_data)
+        # Create the initial weekly trends filter with dynamic games; the copy reuses the
+        # already validated static filters and adds the separately validated games filter
+        initial_filter = INITIAL_FILTER.model_copy(update={
+            "games_applicable": GamesApplicableFilter(games=current_games, match_mode="contains_any")
+        })
         
-        # Generate the actual cache key for this filter
-        cache_key = generate_cache_key(initial_filter.dict())
+        # Execute the initial query and its sort variants concurrently, each on its own
+        # session, and cache every result under the key its request would generate
+        variant_filters = [initial_filter.model_copy(update={"sort_by": sort_by}) for sort_by in WARM_SORT_VARIANTS]
+        (cache_key, initial_result), *_ = await asyncio.gather(
+            *(asyncio.to_thread(warm_weekly_trends, weekly_filter) for weekly_filter in (initial_filter, *variant_filters))
+        )
         
-        # Execute the initial query and cache the result using the generated key
-        initial_result = get_trends(initial_filter, db_session)
-        set_weekly_trends_cache(cache_key, initial_result)
+        # One summary line built from the results already in hand
+        logger.info(
+            "Cache initialization completed: %d upcoming games; weekly filter options with %d months, %d spreads, %d totals; "
+            "initial weekly trends %s (%d bytes, %d sort variants also cached)",
+            len(upcoming_games_result["upcoming_games"]),
+            len(filter_options["months"]),
+            len(filter_options["spreads"]),
+            len(filter_options["totals"]),
+            cache_key,
+            len(initial_result or b""),
+            len(variant_filters)
+        )
         
-        print("✅ Cache initialization completed successfully")
-        print(f"✅ Cached upcoming games: {len(upcoming_games_result.get('upcoming_games', []))} games")
-        # Get cached filter options for logging
-        cached_filters = get_weekly_filter_options_from_cache()
-        print(f"✅ Cached weekly filter options: {len(cached_filters.get('months', []))} months, {len(cached_filters.get('spreads', []))} spreads, {len(cached_filters.get('totals', []))} totals")
-        print(f"✅ Cached initial weekly trends: {len(initial_result)} trends")
-        print(f"✅ Initial weekly trends cache key: {cache_key}")
-        
-    except Exception as e:
-        print(f"❌ Error during cache initialization: {str(e)}")
+    except Exception:
+        logger.exception("Error during cache initialization")
         # Don't raise the exception to prevent app startup failure
     finally:
         if 'db_session' in locals():
             db_session.close()
+        if 'filter_session' in locals():
+            filter_session.close()
@@ -0,0 +1,9 @@
+-- Adds the generated month_num column used by /trends month ranges and month sorting.
+-- Run once against existing databases before deploying; safe to re-run.
+ALTER TABLE trends ADD COLUMN IF NOT EXISTS month_num SMALLINT GENERATED ALWAYS AS (
+    CASE month WHEN 'January' THEN 1 WHEN 'February' THEN 2 WHEN 'March' THEN 3 WHEN 'April' THEN 4
+               WHEN 'May' THEN 5 WHEN 'June' THEN 6 WHEN 'July' THEN 7 WHEN 'August' THEN 8
+               WHEN 'September' THEN 9 WHEN 'October' THEN 10 WHEN 'November' THEN 11 WHEN 'December' THEN 12 END
+) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_trends_month_num ON trends (month_num);
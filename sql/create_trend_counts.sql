@@ -0,0 +1,7 @@
+-- Summary of trend counts per grouped filter column, read by /trends for total_count.
+-- Requires sql/add_trends_month_num.sql. Refresh after every trends load:
+--     REFRESH MATERIALIZED VIEW trend_counts;
+CREATE MATERIALIZED VIEW IF NOT EXISTS trend_counts AS
+SELECT category, month, month_num, day_of_week, spread, total, COUNT(*) AS trend_count
+FROM trends
+GROUP BY category, month, month_num, day_of_week, spread, total;